@@ -0,0 +1,468 @@
+#! /usr/bin/env python3
+
+# Tools that work across all of the days rather than running one at a time. See ./aoc.py --help
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+import aoc_utils
+
+
+def print_table(title, columns, rows):
+    """ Print rows (lists of strings, one per column) as a rich table, or as plain text or JSON when
+    headless.
+    """
+    if aoc_utils.HEADLESS == 'json':
+        print(json.dumps([dict(zip(columns, row)) for row in rows]))
+        return
+    if aoc_utils.HEADLESS:
+        rows = [[aoc_utils.PlainConsole.MARKUP.sub('', cell) for cell in row] for row in rows]
+        widths = [max(len(cell) for cell in column) for column in zip(columns, *rows)]
+        print(title)
+        for row in [columns] + rows:
+            print('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+        return
+    from rich.table import Table
+    table = Table(title=title)
+    for column in columns:
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*row)
+    aoc_utils.console.print(table)
+
+
+def run_all(args):
+    """ Run every part of every day (or just args.days) in parallel and print a report.
+    """
+    reports, wall_ns = aoc_utils.run_all_days(args.days or None, args.workers, use_cache=not args.no_cache,
+                                              memory=args.memory, timeout=args.timeout,
+                                              memory_limit=args.memory_limit)
+    columns = ['Day', 'Part', 'Test', 'Result', 'Duration']
+    if args.memory:
+        columns += ['Peak memory', 'RSS delta']
+    rows = []
+    for r in reports:
+        if 'error' in r:
+            status = r.get('status', 'error')
+            rows.append([r['day'], r['part'], f'[red]{status}', r['error']] + [''] * (len(columns) - 4))
+            continue
+        test = '[green]ok' if r['test_passed'] else f'[red]got {r["test_result"]}'
+        duration = aoc_utils.format_ns(r['duration_ns']) + (' (cached)' if r['cached'] else '')
+        row = [r['day'], r['part'], test, str(r['result']), duration]
+        if args.memory:
+            row += [aoc_utils.format_bytes(r['memory']['peak_bytes']),
+                    aoc_utils.format_bytes(r['memory']['rss_delta_bytes'])]
+        rows.append(row)
+    print_table('All days', columns, rows)
+    total_ns = sum(r.get('duration_ns', 0) for r in reports)
+    if aoc_utils.HEADLESS != 'json':
+        aoc_utils.console.print(f'[yellow]Wall clock:[/] {aoc_utils.format_ns(wall_ns)} '
+                                f'[yellow]Sum of parts:[/] {aoc_utils.format_ns(total_ns)}')
+    if args.json:
+        with args.json.open('w') as f:
+            json.dump({'wall_ns': wall_ns, 'parts': reports}, f, indent=2, default=str)
+    return 0 if all(r.get('test_passed') for r in reports) else 1
+
+
+def complexity(args):
+    """ Time one part over a geometric series of generated input sizes and report the best fitting
+    complexity class.
+    """
+    import aoc_inputs
+    start = args.start or max(1, aoc_inputs.DEFAULT_SIZES[args.day] // 4)
+    sizes = sorted({max(1, round(start * args.factor ** i)) for i in range(args.steps)})
+    measurements = aoc_utils.scaling_benchmark(args.day, args.part, sizes, args.seed, args.repeat, args.budget)
+    print_table(f'Day {args.day} part {args.part} scaling', ['Size', 'Min', 'Median', 'Runs'],
+                [[str(size), aoc_utils.format_ns(stats['min_ns']), aoc_utils.format_ns(stats['median_ns']),
+                  str(stats['runs'])] for size, stats in measurements])
+    if len(measurements) < 3:
+        aoc_utils.console.print('[red]Need at least 3 sizes to fit, try a smaller --start or bigger --budget')
+        return 1
+    fit = aoc_utils.fit_complexity([size for size, _ in measurements], [stats['min_ns'] for _, stats in measurements])
+    print_table('Fits (error is RMS of log time)', ['Class', 'Error'],
+                [[name, f'{error:.3f}'] for error, name, _ in fit['fits']])
+    if aoc_utils.HEADLESS != 'json':
+        aoc_utils.console.print(f'[yellow]Best fit:[/] {fit["best"]} '
+                                f'[yellow]Empirical exponent:[/] n^{fit["exponent"]:.2f}')
+    if args.json:
+        with args.json.open('w') as f:
+            json.dump({'day': args.day, 'part': args.part, 'seed': args.seed,
+                       'measurements': [dict(stats, size=size) for size, stats in measurements],
+                       'best': fit['best'], 'exponent': fit['exponent'],
+                       'fits': [{'class': name, 'error': error, 'c': c} for error, name, c in fit['fits']]},
+                      f, indent=2)
+    return 0
+
+
+def compare(args):
+    """ Compare the current commit's recorded timings with a baseline and flag regressions.
+    """
+    comparisons = aoc_utils.compare_history(args.threshold, args.baseline, args.current)
+    rows = []
+    for c in comparisons:
+        status = '[red]slower' if c['regressed'] else '[green]ok'
+        rows.append([c['day'], c['part'], c['mode'], c['input_hash'][:10], c['baseline_commit'][:10],
+                     aoc_utils.format_ns(c['baseline_ns']), aoc_utils.format_ns(c['current_ns']),
+                     f'{c["change"]:+.1%}', status])
+    print_table(f'Compared with threshold {args.threshold:.0%}',
+                ['Day', 'Part', 'Mode', 'Input', 'Baseline', 'Baseline time', 'Current time', 'Change', 'Status'], rows)
+    if not comparisons and aoc_utils.HEADLESS != 'json':
+        aoc_utils.console.print('[yellow]Nothing to compare, run some days at this commit and at the baseline first')
+    return 1 if any(c['regressed'] for c in comparisons) else 0
+
+
+def differential(args):
+    """ Check that each day's reference and optimized solvers agree on growing generated inputs and
+    report the speedup.
+    """
+    import aoc_inputs
+    if not aoc_utils.load_day(args.day).differential_pairs:
+        aoc_utils.console.print(f'[red]Day {args.day} has no differential_pairs')
+        return 1
+    start = args.start or max(1, aoc_inputs.DEFAULT_SIZES[args.day] // 4)
+    sizes = sorted({max(1, round(start * args.factor ** i)) for i in range(args.steps)})
+    reports = aoc_utils.differential(args.day, sizes, args.seed, args.repeat, args.budget)
+    rows = []
+    for r in reports:
+        status = '[green]match' if r['match'] else f'[red]{r["reference_result"]} != {r["optimized_result"]}'
+        rows.append([f'{r["reference"]} vs {r["optimized"]}', str(r['size']), status,
+                     aoc_utils.format_ns(r['reference_ns']), aoc_utils.format_ns(r['optimized_ns']),
+                     f'{r["speedup"]:.1f}x'])
+    print_table(f'Day {args.day} reference vs optimized', ['Pair', 'Size', 'Answers', 'Reference', 'Optimized',
+                                                            'Speedup'], rows)
+    if args.json:
+        with args.json.open('w') as f:
+            json.dump(reports, f, indent=2, default=str)
+    return 0 if all(r['match'] for r in reports) else 1
+
+
+def check_inputs(args):
+    """ Run days on generated inputs over the sizes the complexity sweep uses, and report any part that
+    fails or doesn't finish in time.
+    """
+    import aoc_inputs
+    rows = []
+    failed = False
+    for day in args.days or sorted(aoc_inputs.GENERATORS):
+        start = args.start or max(1, aoc_inputs.DEFAULT_SIZES[day] // 4)
+        sizes = sorted({max(1, round(start * args.factor ** i)) for i in range(args.steps)})
+        for r in aoc_utils.check_generated(day, sizes, args.parts, args.seed, args.timeout):
+            failed |= r['status'] != 'ok'
+            outcome = str(r['result']) if r['status'] == 'ok' else r['error']
+            rows.append([day, r['part'], str(r['size']), '[green]ok' if r['status'] == 'ok' else f'[red]{r["status"]}',
+                         outcome])
+    print_table('Generated inputs', ['Day', 'Part', 'Size', 'Status', 'Result'], rows)
+    return 1 if failed else 0
+
+
+def cross_benchmark(args):
+    """ Compare the Python and Go versions of a day on growing generated inputs.
+    """
+    import aoc_inputs
+    start = args.start or aoc_inputs.DEFAULT_SIZES[args.day]
+    sizes = sorted({max(1, round(start * args.factor ** i)) for i in range(args.steps)})
+    reports = aoc_utils.cross_benchmark(args.day, sizes, args.seed, args.repeat, args.budget)
+    rows = []
+    for r in reports:
+        answers = '[green]match' if r['match'] else f'[red]{r["python_result"]} != {r["go_result"]}'
+        rows.append([r['part'], str(r['size']), answers, aoc_utils.format_ns(r['python_ns']),
+                     aoc_utils.format_ns(r['go_ns']), f'{r["python_per_second"]:,.0f}/s',
+                     f'{r["go_per_second"]:,.0f}/s', f'{r["ratio"]:.1f}x'])
+    print_table(f'Day {args.day} Python vs Go', ['Part', 'Size', 'Answers', 'Python', 'Go', 'Python throughput',
+                                                 'Go throughput', 'Go faster by'], rows)
+    if args.json:
+        with args.json.open('w') as f:
+            json.dump(reports, f, indent=2)
+    return 0 if all(r['match'] for r in reports) else 1
+
+
+def monitor(args):
+    """ Count day 01 depth increases on a feed of depths as they arrive, printing the running counts.
+    """
+    sonar = aoc_utils.load_day('01').module
+    feed = sys.stdin if str(args.input) == '-' else args.input.open()
+    monitor = sonar.SonarMonitor(args.windows)
+    try:
+        for samples, counts in monitor.watch(feed, args.every, args.seconds):
+            if aoc_utils.HEADLESS == 'json':
+                print(json.dumps({'samples': samples, 'increases': counts}), flush=True)
+            else:
+                aoc_utils.console.print(f'[yellow]Samples:[/] {samples} ' +
+                                        ' '.join(f'[yellow]Window {w}:[/] {n}' for w, n in counts.items()))
+                sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if feed is not sys.stdin:
+            feed.close()
+    return 0
+
+
+def generate(args):
+    """ Write a generated input for a day, to args.output or to stdout.
+    """
+    import aoc_inputs
+    text = aoc_inputs.generate(args.day, args.size, args.seed)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def batch(args):
+    """ Run one day over many input files with warm workers and report throughput.
+    """
+    input_paths = aoc_utils.batch_inputs(args.inputs)
+    if not input_paths:
+        aoc_utils.console.print(f'[red]No input files match {" ".join(args.inputs)}')
+        return 1
+    parts = [args.part] if args.part else aoc_utils.PARTS
+    reports, wall_ns = aoc_utils.run_batch(args.day, input_paths, parts, args.workers, use_cache=not args.no_cache)
+    rows = []
+    for r in reports:
+        if 'error' in r:
+            rows.append([r['input'], r['part'], '[red]error', r['error']])
+        else:
+            duration = aoc_utils.format_ns(r['duration_ns']) + (' (cached)' if r['cached'] else '')
+            rows.append([r['input'], r['part'], str(r['result']), duration])
+    print_table(f'Day {args.day} batch', ['Input', 'Part', 'Result', 'Duration'], rows)
+    throughput = len(input_paths) / (wall_ns / 1e9)
+    if aoc_utils.HEADLESS != 'json':
+        aoc_utils.console.print(f'[yellow]Inputs:[/] {len(input_paths)} [yellow]Wall clock:[/] '
+                                f'{aoc_utils.format_ns(wall_ns)} [yellow]Throughput:[/] {throughput:.1f} inputs/s')
+    if args.json:
+        with args.json.open('w') as f:
+            json.dump({'day': args.day, 'inputs': len(input_paths), 'wall_ns': wall_ns,
+                       'inputs_per_second': throughput, 'runs': reports}, f, indent=2, default=str)
+    return 0 if not any('error' in r for r in reports) else 1
+
+
+def serve(args):
+    """ Run the solver daemon until interrupted.
+    """
+    import aoc_server
+    aoc_server.serve(args.workers, not args.no_cache, args.socket or aoc_server.DAEMON_SOCKET, args.port)
+    return 0
+
+
+def submit(args):
+    """ Send a job to the solver daemon and print the answer, timing the round trip.
+    """
+    import statistics
+    import aoc_server
+    latencies = []
+    with aoc_server.SolverClient(args.socket or aoc_server.DAEMON_SOCKET, args.port) as client:
+        for i in range(args.repeat):
+            start = time.perf_counter_ns()
+            report = client.solve(args.day, args.part, path=args.input)
+            latencies.append(time.perf_counter_ns() - start)
+    if 'error' in report:
+        aoc_utils.console.print(f'[red]{report["error"]}')
+        return 1
+    if aoc_utils.HEADLESS == 'json':
+        print(json.dumps(dict(report, latency_ns=latencies), default=str))
+        return 0
+    aoc_utils.console.print(f'[bold red]Result:[/] [magenta on yellow]{report["result"]}[/] '
+                            f'[yellow]Solve:[/] {aoc_utils.format_ns(report["duration_ns"])}'
+                            f'{" (cached)" if report["cached"] else ""}')
+    aoc_utils.console.print(f'[yellow]Round trip:[/] {len(latencies)} requests '
+                            f'min={aoc_utils.format_ns(min(latencies))} '
+                            f'median={aoc_utils.format_ns(int(statistics.median(latencies)))}')
+    return 0
+
+
+def clear_cache(args):
+    """ Throw away every stored result.
+    """
+    aoc_utils.CACHE.clear()
+    return 0
+
+
+# One line of python -X importtime output, e.g.
+# import time:       621 |       2711 |   rich.console
+# Nesting is shown by indenting the package name, top level imports have a single space.
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+
+def measure_startup(code, env, repeat):
+    """ Run code in a fresh interpreter with -X importtime repeat times. Return (best wall clock
+    in ns, total import time in µs, [(cumulative µs, module)] for top level imports) from the
+    fastest run.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter_ns()
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env,
+                              capture_output=True, text=True, check=True)
+        wall_ns = time.perf_counter_ns() - start
+        top_level = []
+        for match in IMPORTTIME_LINE.finditer(proc.stderr):
+            if len(match.group(3)) == 1:
+                top_level.append((int(match.group(2)), match.group(4)))
+        if best is None or wall_ns < best[0]:
+            best = (wall_ns, sum(us for us, _ in top_level), sorted(top_level, reverse=True))
+    return best
+
+
+def startup(args):
+    """ Measure interpreter startup plus the import cost of each day module, normally and headless.
+    """
+    days = args.days or list(aoc_utils.day_paths())
+    results = {}
+    rows = []
+    for day in days:
+        # Importing a day defines its parts but doesn't run them
+        code = (f'import sys; sys.path.insert(0, {str(aoc_utils.ROOT)!r}); import aoc_utils; '
+                f'aoc_utils.load_day({day!r})')
+        results[day] = {}
+        for mode, headless in (('rich', ''), ('headless', '1')):
+            env = dict(os.environ, AOC_HEADLESS=headless)
+            wall_ns, import_us, top_level = measure_startup(code, env, args.repeat)
+            results[day][mode] = {'wall_ns': wall_ns, 'import_us': import_us,
+                                  'top_imports': [{'module': m, 'cumulative_us': us} for us, m in top_level[:5]]}
+        rich_run = results[day]['rich']
+        headless_run = results[day]['headless']
+        rows.append([day, aoc_utils.format_ns(rich_run['wall_ns']), aoc_utils.format_ns(rich_run['import_us'] * 1000),
+                     aoc_utils.format_ns(headless_run['wall_ns']),
+                     aoc_utils.format_ns(headless_run['import_us'] * 1000),
+                     ', '.join(i['module'] for i in headless_run['top_imports'][:3])])
+    print_table('Startup', ['Day', 'Wall', 'Imports', 'Headless wall', 'Headless imports', 'Heaviest headless imports'],
+                rows)
+    if args.json:
+        with args.json.open('w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Advent of Code 2021 tools',
+                                     epilog='--headless or --headless=json anywhere on the command line (or '
+                                            'AOC_HEADLESS=1/json) prints plain text or JSON without importing rich.')
+    subparsers = parser.add_subparsers(required=True)
+
+    p = subparsers.add_parser('run-all', help='Run all days in parallel and report results and timings')
+    p.add_argument('days', nargs='*', help='Days to run, e.g. 05 12 (default all)')
+    p.add_argument('--workers', type=int, help='Number of worker processes (default one per core)')
+    p.add_argument('--json', type=Path, help='Also write the report to this JSON file')
+    p.add_argument('--no-cache', action='store_true', help="Ignore and don't store cached results")
+    p.add_argument('--memory', action='store_true', help='Measure peak memory of each part with tracemalloc')
+    p.add_argument('--timeout', type=float, default=aoc_utils.TIMEOUT,
+                   help='Kill and report any part that takes longer than this many seconds (default AOC_TIMEOUT)')
+    p.add_argument('--memory-limit', type=aoc_utils.parse_size, default=aoc_utils.MEMORY_LIMIT,
+                   help='Cap each worker process at this much memory, e.g. 2G (default AOC_MEMORY_LIMIT)')
+    p.set_defaults(func=run_all)
+
+    p = subparsers.add_parser('compare', help='Flag parts that got slower than their recorded baseline')
+    p.add_argument('--threshold', type=float, default=0.1,
+                   help='Fraction slower than the baseline that counts as a regression (default 0.1)')
+    p.add_argument('--baseline', help='Commit to compare against (default the most recent other commit per part)')
+    p.add_argument('--current', help='Commit to check (default the one the tree is at, including -dirty)')
+    p.set_defaults(func=compare)
+
+    p = subparsers.add_parser('complexity', help='Fit the time of one part over growing generated inputs')
+    p.add_argument('day', help='Day, e.g. 07')
+    p.add_argument('part', choices=aoc_utils.PARTS)
+    p.add_argument('--start', type=int, help='Smallest size (default a quarter of the real input size)')
+    p.add_argument('--factor', type=float, default=2, help='Each size is this many times the previous one')
+    p.add_argument('--steps', type=int, default=5, help='Number of sizes')
+    p.add_argument('--seed', type=int, default=0, help='Seed for the generated inputs')
+    p.add_argument('--repeat', type=int, default=3, help='Runs per size, the fastest is used')
+    p.add_argument('--budget', type=float, default=aoc_utils.BENCHMARK_BUDGET,
+                   help='Seconds per size, bigger sizes are skipped once one run takes longer')
+    p.add_argument('--json', type=Path, help='Also write the measurements and fits to this JSON file')
+    p.set_defaults(func=complexity)
+
+    p = subparsers.add_parser('differential', help="Check a day's reference and optimized solvers agree, and time both")
+    p.add_argument('day', help='Day, e.g. 14')
+    p.add_argument('--start', type=int, help='Smallest size (default a quarter of the real input size)')
+    p.add_argument('--factor', type=float, default=2, help='Each size is this many times the previous one')
+    p.add_argument('--steps', type=int, default=4, help='Number of sizes')
+    p.add_argument('--seed', type=int, default=0, help='Seed for the generated inputs')
+    p.add_argument('--repeat', type=int, default=3, help='Runs per size, the fastest is used')
+    p.add_argument('--budget', type=float, default=aoc_utils.BENCHMARK_BUDGET,
+                   help='Seconds per size, bigger sizes are skipped once the reference takes longer')
+    p.add_argument('--json', type=Path, help='Also write the results to this JSON file')
+    p.set_defaults(func=differential)
+
+    p = subparsers.add_parser('check-inputs', help='Check every part finishes on generated inputs of growing size')
+    p.add_argument('days', nargs='*', help='Days to check (default every day with a generator)')
+    p.add_argument('--parts', nargs='+', choices=aoc_utils.PARTS, default=aoc_utils.PARTS, help='Parts to run')
+    p.add_argument('--start', type=int, help='Smallest size (default a quarter of the real input size)')
+    p.add_argument('--factor', type=float, default=2, help='Each size is this many times the previous one')
+    p.add_argument('--steps', type=int, default=5, help='Number of sizes (default the same as complexity)')
+    p.add_argument('--seed', type=int, default=0, help='Seed for the generated inputs')
+    p.add_argument('--timeout', type=float, default=30, help='Seconds a part may take on one input')
+    p.set_defaults(func=check_inputs)
+
+    p = subparsers.add_parser('cross-benchmark', help='Compare the Python and Go versions of day 01 or 02')
+    p.add_argument('day', choices=['01', '02'])
+    p.add_argument('--start', type=int, help='Smallest size in lines (default about the size of the real input)')
+    p.add_argument('--factor', type=float, default=10, help='Each size is this many times the previous one')
+    p.add_argument('--steps', type=int, default=3, help='Number of sizes')
+    p.add_argument('--seed', type=int, default=0, help='Seed for the generated inputs')
+    p.add_argument('--repeat', type=int, default=5, help='Runs per size, the fastest is used')
+    p.add_argument('--budget', type=float, default=aoc_utils.BENCHMARK_BUDGET, help='Seconds per part and size')
+    p.add_argument('--json', type=Path, help='Also write the results to this JSON file')
+    p.set_defaults(func=cross_benchmark)
+
+    p = subparsers.add_parser('monitor', help='Count day 01 depth increases on a live feed of depths')
+    p.add_argument('input', type=Path, nargs='?', default=Path('-'), help='File or pipe to read (default stdin)')
+    p.add_argument('--windows', type=int, nargs='+', default=[1, 3], help='Window sizes to count (default 1 3)')
+    p.add_argument('--every', type=int, default=1000, help='Report after this many depths (0 for never)')
+    p.add_argument('--seconds', type=float, help='Also report when this many seconds have passed')
+    p.set_defaults(func=monitor)
+
+    p = subparsers.add_parser('generate', help='Generate a synthetic input for a day, see aoc_inputs.py')
+    p.add_argument('day', help='Day to generate an input for, e.g. 09')
+    p.add_argument('--size', type=int, help='How big, the meaning differs by day (default about the size of the real input)')
+    p.add_argument('--seed', type=int, default=0, help='Seed, the same size and seed always give the same input')
+    p.add_argument('-o', '--output', type=Path, help='File to write to (default stdout)')
+    p.set_defaults(func=generate)
+
+    p = subparsers.add_parser('batch', help='Run one day over many input files in a pool of warm workers')
+    p.add_argument('day', help='Day, e.g. 09')
+    p.add_argument('inputs', nargs='+', help="Input files: directories (every .txt in them) or globs, e.g. 'inputs/*.txt'")
+    p.add_argument('--part', choices=aoc_utils.PARTS, help='Only run this part (default both)')
+    p.add_argument('--workers', type=int, help='Number of worker processes (default one per core)')
+    p.add_argument('--json', type=Path, help='Also write the results to this JSON file')
+    p.add_argument('--no-cache', action='store_true', help="Ignore and don't store cached results")
+    p.set_defaults(func=batch)
+
+    p = subparsers.add_parser('serve', help='Run a daemon that answers solve jobs from warm worker processes')
+    p.add_argument('--workers', type=int, help='Number of worker processes (default one per core)')
+    p.add_argument('--socket', type=Path, default=None, help='Unix socket to listen on (default AOC_DAEMON_SOCKET)')
+    p.add_argument('--port', type=int, help='Listen on this localhost TCP port instead of a Unix socket')
+    p.add_argument('--no-cache', action='store_true', help="Ignore and don't store cached results")
+    p.set_defaults(func=serve)
+
+    p = subparsers.add_parser('submit', help='Solve an input with a running daemon')
+    p.add_argument('day', help='Day, e.g. 09')
+    p.add_argument('part', choices=aoc_utils.PARTS)
+    p.add_argument('input', type=Path, help='Input file')
+    p.add_argument('--socket', type=Path, default=None, help='Unix socket the daemon is on (default AOC_DAEMON_SOCKET)')
+    p.add_argument('--port', type=int, help='Connect to this localhost TCP port instead of a Unix socket')
+    p.add_argument('--repeat', type=int, default=1, help='Send the job this many times and report the latency')
+    p.set_defaults(func=submit)
+
+    p = subparsers.add_parser('clear-cache', help='Delete all cached results')
+    p.set_defaults(func=clear_cache)
+
+    p = subparsers.add_parser('startup', help='Measure python -X importtime startup cost of each day module')
+    p.add_argument('days', nargs='*', help='Days to measure, e.g. 01 21 (default all)')
+    p.add_argument('--repeat', type=int, default=3, help='Runs per measurement, the fastest is kept')
+    p.add_argument('--json', type=Path, help='Also write the measurements to this JSON file')
+    p.set_defaults(func=startup)
+
+    # aoc_utils has already read --headless when it was imported
+    args = parser.parse_args([arg for arg in sys.argv[1:] if not arg.startswith('--headless')])
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,499 @@
+# Synthetic puzzle inputs. The checked in inputs are all about the same (small) size, which says nothing
+# about how a solver scales. Each day has a generator here that writes a valid input of any size, always
+# the same one for the same size and seed, e.g.
+#   ./aoc.py generate 09 --size 1000
+#   AOC_INPUT_SIZE=1000 AOC_BENCHMARK=1 ./day09.py
+# What size means differs by day (lines, grid side, number of boards...), see each generator's docstring.
+# DEFAULT_SIZES is roughly the size of the real inputs.
+
+import itertools
+import os
+import random
+from pathlib import Path
+
+GENERATED_DIR = Path(os.environ.get('AOC_INPUTS_DIR', Path(__file__).parent / '.aoc_inputs'))
+
+GENERATORS = {}
+DEFAULT_SIZES = {}
+
+
+def generator(day, default_size):
+    """ Decorator that registers a function (size, rng) -> list of lines as the generator for day
+    """
+    def register(the_func):
+        GENERATORS[day] = the_func
+        DEFAULT_SIZES[day] = default_size
+        return the_func
+    return register
+
+
+def generate(day, size=None, seed=0):
+    """ Return the text of a generated input for day. The same size and seed always give the same text.
+    """
+    if day not in GENERATORS:
+        raise KeyError(f'No input generator for day {day}')
+    rng = random.Random(f'{day}-{seed}')
+    lines = GENERATORS[day](DEFAULT_SIZES[day] if size is None else size, rng)
+    return '\n'.join(lines) + '\n'
+
+
+def generated_input(day, size=None, seed=0, directory=GENERATED_DIR):
+    """ Return the path of a generated input for day, writing it to directory if it isn't there yet or
+    the generators changed since it was written
+    """
+    size = DEFAULT_SIZES[day] if size is None else size
+    path = directory / f'day{day}-{size}-{seed}.txt'
+    if not path.exists() or path.stat().st_mtime < Path(__file__).stat().st_mtime:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+        tmp_path.write_text(generate(day, size, seed))
+        tmp_path.rename(path)
+    return path
+
+
+def cave_name(i, upper=False):
+    """ Return a unique name made of letters for cave number i, e.g. 0 -> 'aa'
+    """
+    letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ' if upper else 'abcdefghijklmnopqrstuvwxyz'
+    name = ''
+    while True:
+        i, r = divmod(i, 26)
+        name = letters[r] + name
+        if i == 0 and len(name) >= 2:
+            return name
+
+
+def digit_grid(side, rng, digits='0123456789'):
+    """ Return side lines of side random digits
+    """
+    return [''.join(rng.choices(digits, k=side)) for _ in range(side)]
+
+
+@generator('01', 2000)
+def day01(size, rng):
+    """ size depth readings, a random walk that mostly gets deeper
+    """
+    depth = rng.randrange(100, 200)
+    lines = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        lines.append(str(depth))
+    return lines
+
+
+@generator('02', 1000)
+def day02(size, rng):
+    """ size commands, never going up out of the water
+    """
+    depth = 0
+    lines = []
+    for _ in range(size):
+        command = rng.choice(('forward', 'forward', 'down', 'up'))
+        amount = rng.randint(1, 9)
+        if command == 'up' and amount > depth:
+            command = 'down'
+        depth += {'forward': 0, 'down': amount, 'up': -amount}[command]
+        lines.append(f'{command} {amount}')
+    return lines
+
+
+def has_ratings(numbers, width):
+    """ Return True if part b of day 03 narrows numbers down to exactly one reading for both ratings.
+    It doesn't for about one random sample in five: the least common bit walk can reach a bit all the
+    candidates share and be left with none.
+    """
+    for most_common in (True, False):
+        candidates = numbers
+        for bit in reversed(range(width)):
+            ones = [n for n in candidates if n >> bit & 1]
+            zeros = [n for n in candidates if not n >> bit & 1]
+            candidates = ones if (len(ones) >= len(zeros)) == most_common else zeros
+            if len(candidates) <= 1:
+                break
+        if len(candidates) != 1:
+            return False
+    return True
+
+
+@generator('03', 1000)
+def day03(size, rng):
+    """ size (at least 2) distinct binary numbers, at least 12 bits wide, drawn again until part b has
+    an answer. They have to be distinct or part b could be left with more than one rating.
+    """
+    size = max(2, size)
+    width = max(12, size.bit_length() + 1)
+    while True:
+        numbers = rng.sample(range(1 << width), size)
+        if has_ratings(numbers, width):
+            return [format(n, f'0{width}b') for n in numbers]
+
+
+@generator('04', 100)
+def day04(size, rng):
+    """ size bingo boards
+    """
+    picks = list(range(100))
+    rng.shuffle(picks)
+    lines = [','.join(map(str, picks))]
+    for _ in range(size):
+        numbers = rng.sample(range(100), 25)
+        lines.append('')
+        for row in range(5):
+            lines.append(' '.join(f'{n:2}' for n in numbers[row * 5:row * 5 + 5]))
+    return lines
+
+
+@generator('05', 500)
+def day05(size, rng):
+    """ size horizontal, vertical and diagonal vents on a 1000x1000 floor
+    """
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)))
+        # The furthest we can go in that direction without leaving the floor
+        limits = [1000]
+        if dx:
+            limits.append(999 - x1 if dx > 0 else x1)
+        if dy:
+            limits.append(999 - y1 if dy > 0 else y1)
+        length = rng.randint(0, min(limits))
+        lines.append(f'{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}')
+    return lines
+
+
+@generator('06', 300)
+def day06(size, rng):
+    """ size lanternfish timers
+    """
+    return [','.join(str(rng.randint(1, 5)) for _ in range(size))]
+
+
+@generator('07', 1000)
+def day07(size, rng):
+    """ size crab positions between 0 and 2000
+    """
+    return [','.join(str(int(rng.triangular(0, 2000, 300))) for _ in range(size))]
+
+
+# The segments lit for each digit on a correctly wired display
+SEGMENTS = ('abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg')
+
+
+@generator('08', 200)
+def day08(size, rng):
+    """ size displays, each with its own random wiring
+    """
+    lines = []
+    for _ in range(size):
+        wiring = dict(zip('abcdefg', rng.sample('abcdefg', 7)))
+
+        def scramble(segments):
+            return ''.join(rng.sample([wiring[s] for s in segments], len(segments)))
+
+        patterns = [scramble(segments) for segments in rng.sample(SEGMENTS, 10)]
+        outputs = [scramble(rng.choice(SEGMENTS)) for _ in range(4)]
+        lines.append(f'{" ".join(patterns)} | {" ".join(outputs)}')
+    return lines
+
+
+@generator('09', 100)
+def day09(size, rng):
+    """ A size x size height map. Uniformly random digits would make one basin of nearly everything,
+    so instead cells belong to the nearest of a set of random low points, with ridges of 9s where
+    neighbouring basins meet and heights going up with distance from the low point.
+    """
+    cells = size * size
+    seeds = rng.sample(range(cells), max(3, cells // 80))
+    basin = [-1] * cells
+    height = [0] * cells
+    for seed in seeds:
+        basin[seed] = seed
+    # Breadth first from all the low points at once, so each cell is claimed by its nearest
+    frontier = seeds
+    while frontier:
+        next_frontier = []
+        for cell in frontier:
+            row, col = divmod(cell, size)
+            for neighbour, ok in ((cell - size, row > 0), (cell + size, row < size - 1),
+                                  (cell - 1, col > 0), (cell + 1, col < size - 1)):
+                if ok and basin[neighbour] == -1:
+                    basin[neighbour] = basin[cell]
+                    height[neighbour] = min(8, height[cell] + 1)
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    lines = []
+    for row in range(size):
+        line = []
+        for col in range(size):
+            cell = row * size + col
+            ridge = ((col < size - 1 and basin[cell + 1] != basin[cell]) or
+                     (row < size - 1 and basin[cell + size] != basin[cell]))
+            line.append('9' if ridge else str(height[cell]))
+        lines.append(''.join(line))
+    return lines
+
+
+BRACKETS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+
+@generator('10', 110)
+def day10(size, rng):
+    """ size lines of navigation subsystem, each one either corrupted or incomplete. An odd number are
+    incomplete so that part b has a middle score.
+    """
+    num_incomplete = max(1, size // 2) | 1
+    kinds = [True] * min(num_incomplete, size) + [False] * (size - min(num_incomplete, size))
+    rng.shuffle(kinds)
+    lines = []
+    for incomplete in kinds:
+        length = rng.randint(40, 110)
+        corrupt_at = None if incomplete else rng.randrange(length // 2, length)
+        corrupted = False
+        line = []
+        stack = []
+        for i in range(length):
+            if i == corrupt_at and stack:
+                expected = BRACKETS[stack.pop()]
+                line.append(rng.choice([c for c in BRACKETS.values() if c != expected]))
+                corrupted = True
+            elif stack and rng.random() < 0.45:
+                line.append(BRACKETS[stack.pop()])
+            else:
+                stack.append(rng.choice('([{<'))
+                line.append(stack[-1])
+        if incomplete and not stack:
+            line.append('(')
+        elif not incomplete and not corrupted:
+            # The stack happened to be empty when it was time to corrupt the line
+            line.extend('(]')
+        lines.append(''.join(line))
+    return lines
+
+
+@generator('11', 10)
+def day11(size, rng):
+    """ A size x size grid of octopuses with energies of 0 or 1. Random digit grids mostly never
+    synchronize (they fall into a cycle and part b never returns), but these always do on step 9, the
+    first one anything flashes: every octopus is at 9 or flashing by then, and the flashes spread
+    through the 9s to the whole grid. So part b takes 9 steps (10 if there are no 1s) whatever the size.
+    """
+    return digit_grid(size, rng, '01')
+
+
+@generator('12', 7)
+def day12(size, rng):
+    """ A cave system with size small caves and roughly a third as many big ones. Big caves are never
+    connected to each other (there would be infinitely many paths). The number of paths grows very
+    quickly with size.
+    """
+    small = [cave_name(i) for i in range(size)]
+    big = [cave_name(i, upper=True) for i in range(max(1, size // 3))]
+    edges = set()
+    for cave in small:
+        for other in rng.sample(big, min(len(big), rng.randint(1, 2))):
+            edges.add((cave, other))
+        if rng.random() < 0.3:
+            other = rng.choice(small)
+            if other != cave:
+                edges.add((cave, other))
+    for end in ('start', 'end'):
+        for other in rng.sample(small + big, min(size, 2)):
+            edges.add((end, other) if rng.random() < 0.5 else (other, end))
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return [f'{a}-{b}' for a, b in edges]
+
+
+@generator('13', 900)
+def day13(size, rng):
+    """ size distinct dots and enough folds that the paper is at least twice that many squares. The
+    dots are made by unfolding random dots on the final 40x6 sheet, so none lands on a fold line.
+    """
+    width, height = 40, 6
+    folds = []
+    while width * height < 2 * size:
+        if len(folds) % 2 == 0:
+            folds.append(('x', width))
+            width = 2 * width + 1
+        else:
+            folds.append(('y', height))
+            height = 2 * height + 1
+    folds.reverse()
+    dots = set()
+    while len(dots) < min(size, width * height // 2):
+        x, y = rng.randrange(40), rng.randrange(6)
+        for axis, line in reversed(folds):
+            if rng.random() < 0.5:
+                if axis == 'x':
+                    x = 2 * line - x
+                else:
+                    y = 2 * line - y
+        dots.add((x, y))
+    dots = list(dots)
+    rng.shuffle(dots)
+    return [f'{x},{y}' for x, y in dots] + [''] + [f'fold along {axis}={line}' for axis, line in folds]
+
+
+@generator('14', 20)
+def day14(size, rng):
+    """ A polymer template size elements long and an insertion rule for every pair of 10 elements
+    """
+    elements = 'BCFHKNOPSV'
+    lines = [''.join(rng.choices(elements, k=size)), '']
+    for a, b in itertools.product(elements, repeat=2):
+        lines.append(f'{a}{b} -> {rng.choice(elements)}')
+    return lines
+
+
+@generator('15', 100)
+def day15(size, rng):
+    """ A size x size risk map
+    """
+    return digit_grid(size, rng, '123456789')
+
+
+def packet_bits(budget, rng):
+    """ Return the bits (as a string) of a random packet made of about budget packets
+    """
+    version = format(rng.randrange(8), '03b')
+    if budget <= 1:
+        # Literal, split into 4 bit groups
+        value = format(rng.randrange(1 << rng.choice((4, 8, 12, 16))), 'b')
+        value = value.zfill(-(-len(value) // 4) * 4)
+        groups = [value[i:i + 4] for i in range(0, len(value), 4)]
+        return version + '100' + ''.join(('1' if i < len(groups) - 1 else '0') + g for i, g in enumerate(groups))
+    # Comparisons take exactly two operands. Products of lots of packets get enormous so keep them small.
+    type_id = rng.choice((0, 0, 1, 2, 3, 5, 6, 7)) if budget > 3 else rng.choice((0, 1, 2, 3, 5, 6, 7))
+    if type_id >= 5:
+        num_children = 2
+    elif type_id == 1:
+        num_children = min(budget - 1, rng.randint(1, 3))
+    else:
+        num_children = min(budget - 1, rng.randint(1, 8), 2047)
+    child_budgets = [1] * num_children
+    for _ in range(budget - 1 - num_children):
+        child_budgets[rng.randrange(num_children)] += 1
+    children = [packet_bits(child_budget, rng) for child_budget in child_budgets]
+    body = ''.join(children)
+    if len(body) < 1 << 15 and rng.random() < 0.5:
+        return version + format(type_id, '03b') + '0' + format(len(body), '015b') + body
+    return version + format(type_id, '03b') + '1' + format(len(children), '011b') + body
+
+
+@generator('16', 60)
+def day16(size, rng):
+    """ A transmission of about size packets
+    """
+    bits = packet_bits(size, rng)
+    bits += '0' * (-len(bits) % 4)
+    return [''.join(format(int(bits[i:i + 4], 2), 'X') for i in range(0, len(bits), 4))]
+
+
+@generator('17', 260)
+def day17(size, rng):
+    """ A target area whose bottom is size below the launcher
+    """
+    left = rng.randint(max(1, size // 12), max(2, size // 8))
+    right = left + rng.randint(1, max(2, size // 6))
+    bottom = -size
+    top = bottom + rng.randint(1, max(2, size // 4))
+    return [f'target area: x={left}..{right}, y={bottom}..{top}']
+
+
+def snailfish_number(depth, rng):
+    """ Return a random reduced snailfish number as a string, nested no deeper than 4 pairs
+    """
+    if depth > 0 and (depth == 4 or rng.random() < 0.4):
+        return str(rng.randrange(10))
+    return f'[{snailfish_number(depth + 1, rng)},{snailfish_number(depth + 1, rng)}]'
+
+
+@generator('18', 100)
+def day18(size, rng):
+    """ size snailfish numbers, already reduced
+    """
+    return [snailfish_number(0, rng) for _ in range(size)]
+
+
+# The 24 ways a scanner can be facing, as (axis permutation, signs) with determinant 1
+ROTATIONS = [(axes, signs) for axes in itertools.permutations(range(3))
+             for signs in itertools.product((1, -1), repeat=3)
+             if signs[0] * signs[1] * signs[2] * (1 if axes in ((0, 1, 2), (1, 2, 0), (2, 0, 1)) else -1) == 1]
+
+
+@generator('19', 30)
+def day19(size, rng):
+    """ size scanners in a chain, each overlapping the previous one by at least 12 beacons
+    """
+    scanners = [(0, 0, 0)]
+    for _ in range(size - 1):
+        axis = rng.randrange(3)
+        offset = [rng.randint(-150, 150) for _ in range(3)]
+        offset[axis] = rng.choice((-1, 1)) * rng.randint(1000, 1200)
+        scanners.append(tuple(s + o for s, o in zip(scanners[-1], offset)))
+
+    def random_beacon(low, high):
+        return tuple(rng.randint(lo, hi) for lo, hi in zip(low, high))
+
+    beacons = set()
+    for i, scanner in enumerate(scanners):
+        low = [s - 1000 for s in scanner]
+        high = [s + 1000 for s in scanner]
+        beacons.update(random_beacon(low, high) for _ in range(15))
+        if i:
+            # Make sure of the overlap with the previous scanner
+            previous = scanners[i - 1]
+            overlap_low = [max(lo, p - 1000) for lo, p in zip(low, previous)]
+            overlap_high = [min(hi, p + 1000) for hi, p in zip(high, previous)]
+            beacons.update(random_beacon(overlap_low, overlap_high) for _ in range(12))
+    lines = []
+    for i, scanner in enumerate(scanners):
+        axes, signs = rng.choice(ROTATIONS)
+        lines.append(f'--- scanner {i} ---')
+        seen = [tuple(b - s for b, s in zip(beacon, scanner)) for beacon in beacons]
+        seen = [relative for relative in seen if all(abs(c) <= 1000 for c in relative)]
+        rng.shuffle(seen)
+        for relative in seen:
+            lines.append(','.join(str(relative[axis] * sign) for axis, sign in zip(axes, signs)))
+        lines.append('')
+    return lines[:-1]
+
+
+@generator('20', 100)
+def day20(size, rng):
+    """ An enhancement algorithm and a size x size image. Like the real inputs the algorithm lights
+    every empty pixel and turns off every lit one, so the infinite background flashes.
+    """
+    algorithm = ['#'] + rng.choices('#.', k=510) + ['.']
+    return [''.join(algorithm), ''] + [''.join(rng.choices('#.', k=size)) for _ in range(size)]
+
+
+@generator('21', 2)
+def day21(size, rng):
+    """ Two starting positions. The input is always the same size so size is ignored.
+    """
+    return [f'Player {player} starting position: {rng.randint(1, 10)}' for player in (1, 2)]
+
+
+@generator('22', 420)
+def day22(size, rng):
+    """ size reboot steps. Like the real inputs the first 20 are in the -50..50 initialization area
+    and the rest are huge.
+    """
+    lines = []
+    for i in range(size):
+        if i < 20:
+            ranges = []
+            for _ in range(3):
+                low = rng.randint(-50, 10)
+                ranges.append((low, rng.randint(low, min(50, low + 50))))
+        else:
+            ranges = []
+            for _ in range(3):
+                low = rng.randint(-100000, 90000)
+                ranges.append((low, low + rng.randint(1000, 60000)))
+        state = 'on' if i == 0 or rng.random() < 0.6 else 'off'
+        (x1, x2), (y1, y2), (z1, z2) = ranges
+        lines.append(f'{state} x={x1}..{x2},y={y1}..{y2},z={z1}..{z2}')
+    return lines
@@ -0,0 +1,205 @@
+# Graph searches shared by the days that walk graphs (9, 12 and 15), so each day only has to build its graph.
+# Nodes are ints 0..n-1 and every search works on preallocated per-node lists rather than dicts and sets of
+# tuples. Graphs are stored in compressed sparse row (CSR) form, or come straight from an aoc_utils.Grid:
+#   graph = aoc_search.Graph.from_grid(grid)
+#   aoc_search.a_star(graph, 0, len(grid) - 1, aoc_search.manhattan(grid, len(grid) - 1))
+# The search loops go one node at a time, where plain lists of ints beat numpy by a distance, so numpy is only
+# used to build the graphs and the loops walk the CSR arrays as flat lists.
+
+import collections
+import functools
+import heapq
+import math
+
+# Distance of nodes a search didn't reach
+UNREACHED = math.inf
+
+
+class Graph:
+    """ A directed, weighted graph over nodes 0..n-1 in CSR form. The edges out of node u go to
+    targets[offsets[u]:offsets[u + 1]] and cost the same slice of weights (all 1 if there are no weights).
+    """
+
+    def __init__(self, offsets, targets, weights=None):
+        import numpy as np
+
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.weights = np.ones(len(self.targets), dtype=np.int64) if weights is None else np.asarray(weights)
+        self.n = len(self.offsets) - 1
+
+    @classmethod
+    def from_edges(cls, n, sources, targets, weights=None, directed=True):
+        """ Make a Graph of n nodes from arrays of edges. If directed is False each edge goes both ways.
+        """
+        import numpy as np
+
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = np.ones(len(sources), dtype=np.int64) if weights is None else np.asarray(weights)
+        if not directed:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+            weights = np.concatenate([weights, weights])
+        order = np.argsort(sources, kind='stable')
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+        return cls(offsets, targets[order], weights[order])
+
+    @classmethod
+    def from_grid(cls, grid, diagonal=False):
+        """ Make the Graph of an aoc_utils.Grid, where each cell is a node joined to its 4 (or 8) neighbours
+        and moving onto a cell costs its value.
+        """
+        import numpy as np
+
+        table = grid.neighbor_table(diagonal)
+        on_grid = table >= 0
+        offsets = np.zeros(len(grid) + 1, dtype=np.int64)
+        np.cumsum(on_grid.sum(axis=1), out=offsets[1:])
+        targets = table[on_grid]
+        return cls(offsets, targets, grid.cells[targets])
+
+    def __repr__(self):
+        return f'Graph({self.n} nodes, {len(self.targets)} edges)'
+
+
+def manhattan(grid, target):
+    """ Return a list of the Manhattan distance from every cell of an aoc_utils.Grid to the cell target. It
+    never overestimates the cost of getting there if every cell costs at least 1, so it suits a_star.
+    """
+    import numpy as np
+
+    rows, cols = np.divmod(np.arange(len(grid)), grid.width)
+    target_row, target_col = grid.coords(target)
+    return (np.abs(rows - target_row) + np.abs(cols - target_col)).tolist()
+
+
+def dijkstra(graph, source, target=None):
+    """ Return a list of the cost of the cheapest path from source to every node, UNREACHED for the ones
+    there isn't a path to. If target is given, stop once its cost is known (other costs may be too high).
+    """
+    return _cheapest_paths(graph, source, target, None)
+
+
+def a_star(graph, source, target, estimates):
+    """ Return the cost of the cheapest path from source to target, or UNREACHED if there's no path.
+    estimates is a list of a guess of the cost from each node to target, which must never be too high
+    (e.g. manhattan for a grid) for the answer to be right.
+    For a great introduction to A* see https://www.redblobgames.com/pathfinding/a-star/introduction.html
+    """
+    return _cheapest_paths(graph, source, target, estimates)[target]
+
+
+def _cheapest_paths(graph, source, target, estimates):
+    """ Dijkstra, or A* if estimates is given. Nodes go on the heap again when a cheaper way to them is
+    found and the stale entries are skipped when they come off it. Dijkstra is A* with every estimate 0,
+    but that's a list of zeros to add, so it gets a loop of its own.
+    """
+    offsets = graph.offsets.tolist()
+    targets = graph.targets.tolist()
+    weights = graph.weights.tolist()
+    cost = [UNREACHED] * graph.n
+    cost[source] = 0
+    frontier = [(0, source)]
+    pop, push = heapq.heappop, heapq.heappush
+    if estimates is None:
+        while frontier:
+            current_cost, current = pop(frontier)
+            if current == target:
+                break
+            if current_cost > cost[current]:
+                continue
+            for edge in range(offsets[current], offsets[current + 1]):
+                next = targets[edge]
+                new_cost = current_cost + weights[edge]
+                if new_cost < cost[next]:
+                    cost[next] = new_cost
+                    push(frontier, (new_cost, next))
+    else:
+        while frontier:
+            priority, current = pop(frontier)
+            if current == target:
+                break
+            current_cost = cost[current]
+            if priority > current_cost + estimates[current]:
+                continue
+            for edge in range(offsets[current], offsets[current + 1]):
+                next = targets[edge]
+                new_cost = current_cost + weights[edge]
+                if new_cost < cost[next]:
+                    cost[next] = new_cost
+                    push(frontier, (new_cost + estimates[next], next))
+    return cost
+
+
+def bfs(graph, sources, passable=None):
+    """ Return a list of the number of edges from the nearest of sources to every node, -1 for the ones
+    that can't be reached. passable is an optional list of bools, the search doesn't go onto nodes where
+    it's False.
+    """
+    distance = [-1] * graph.n
+    offsets, targets = graph.offsets.tolist(), graph.targets.tolist()
+    queue = collections.deque()
+    for source in sources:
+        distance[source] = 0
+        queue.append(source)
+    while queue:
+        current = queue.popleft()
+        next_distance = distance[current] + 1
+        for next in targets[offsets[current]:offsets[current + 1]]:
+            if distance[next] < 0 and (passable is None or passable[next]):
+                distance[next] = next_distance
+                queue.append(next)
+    return distance
+
+
+def connected_components(graph, passable=None):
+    """ Return (labels, count) where labels is a list of the component (0..count-1) each node is in, -1
+    for nodes that aren't passable (see bfs). Edges are treated as going both ways, so make the graph
+    undirected (a grid's is) for the answer to be right.
+    """
+    labels = [-1] * graph.n
+    offsets, targets = graph.offsets.tolist(), graph.targets.tolist()
+    count = 0
+    for start in range(graph.n):
+        if labels[start] >= 0 or (passable is not None and not passable[start]):
+            continue
+        labels[start] = count
+        to_visit = [start]
+        while to_visit:
+            current = to_visit.pop()
+            for next in targets[offsets[current]:offsets[current + 1]]:
+                if labels[next] < 0 and (passable is None or passable[next]):
+                    labels[next] = count
+                    to_visit.append(next)
+        count += 1
+    return labels, count
+
+
+def count_paths(graph, source, target, once, revisits=0):
+    """ Return the number of paths from source to target that never go back to source and visit the nodes
+    where the list of bools once is True at most once each, except that up to revisits times a path may go
+    back to one of them. Other nodes can be visited any number of times, so there mustn't be a cycle made
+    only of them. Paths end when they reach target.
+
+    This is a depth first search, memoized on (node, the once nodes visited so far as a bitmask, revisits
+    left), so paths that reach the same node having used the same nodes are only counted once.
+    """
+    offsets, targets = graph.offsets.tolist(), graph.targets.tolist()
+    bits = [1 << node if once[node] else 0 for node in range(graph.n)]
+
+    @functools.cache
+    def paths_from(node, visited, revisits):
+        if node == target:
+            return 1
+        total = 0
+        for next in targets[offsets[node]:offsets[node + 1]]:
+            if next == source:
+                continue
+            if not visited & bits[next]:
+                total += paths_from(next, visited | bits[next], revisits)
+            elif revisits:
+                total += paths_from(next, visited, revisits - 1)
+        return total
+
+    return paths_from(source, bits[source], revisits)
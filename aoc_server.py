@@ -0,0 +1,191 @@
+# A long running solver daemon. Starting python and importing rich, numpy, networkx and a day module
+# costs far more than solving a small input, so the daemon pays that once: it imports every day into a
+# pool of worker processes and then answers jobs over a Unix socket (or a localhost TCP port).
+#   ./aoc.py serve &
+#   ./aoc.py submit 09 a day09-basins/day09-input.txt
+# The protocol is one JSON object per line each way. A job is
+#   {"id": 1, "day": "09", "part": "a", "input": "<the input text>"}
+# or with "path" (a file the daemon can read) instead of "input". The reply is the run_input report
+# for it, with the same id, or {"id": ..., "error": ...} if it couldn't be run. Jobs on one connection
+# are run concurrently, so replies can come back in a different order. {"op": "ping"} replies with the
+# days loaded and the number of workers.
+
+import asyncio
+import hashlib
+import json
+import os
+import signal
+import socket
+import time
+from pathlib import Path
+import aoc_utils
+
+DAEMON_SOCKET = Path(os.environ.get('AOC_DAEMON_SOCKET', Path(__file__).parent / '.aoc_daemon.sock'))
+# Job inputs sent as text are written here, named by their hash, since the solvers read files
+DAEMON_INPUTS_DIR = Path(os.environ.get('AOC_DAEMON_INPUTS_DIR', Path(__file__).parent / '.aoc_inputs' / 'daemon'))
+# Longest job line we'll accept. Jobs carry whole inputs, so asyncio's default of 64KB is far too small.
+MAX_JOB_BYTES = 256 * 1024 * 1024
+
+
+def input_file(text, directory=DAEMON_INPUTS_DIR):
+    """ Return the path of a file holding text, writing it the first time we see that text
+    """
+    path = directory / f'{hashlib.sha256(text.encode()).hexdigest()}.txt'
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+        tmp_path.write_text(text)
+        tmp_path.rename(path)
+    return path
+
+
+class SolverDaemon:
+    """ Accepts jobs on a socket and runs them in a pool of worker processes that have already
+    imported every day.
+    """
+
+    def __init__(self, workers=None, use_cache=True, root=aoc_utils.ROOT):
+        self.workers = workers or os.cpu_count()
+        self.use_cache = use_cache
+        self.root = root
+        self.days = list(aoc_utils.day_paths(root))
+        self.pool = None
+
+    async def run_job(self, job):
+        """ Return the reply to one job
+        """
+        if job.get('op') == 'ping':
+            return {'id': job.get('id'), 'days': self.days, 'workers': self.workers}
+        source = 'path' if 'path' in job else 'input'
+        for field in ('day', 'part', source):
+            if field not in job:
+                return {'id': job.get('id'), 'error': f'Bad job, missing {field!r}'}
+            if not isinstance(job[field], str):
+                return {'id': job.get('id'), 'error': f'Bad job, {field!r} must be a string'}
+        day, part = job['day'], job['part']
+        input_path = Path(job['path']) if source == 'path' else input_file(job['input'])
+        loop = asyncio.get_running_loop()
+        report = await loop.run_in_executor(self.pool, aoc_utils.run_input, day, part, input_path, self.root,
+                                            self.use_cache)
+        report['id'] = job.get('id')
+        return report
+
+    async def handle_connection(self, reader, writer):
+        """ Read jobs from a client until it disconnects, replying to each as soon as it's done
+        """
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def reply(job):
+            # Every job gets a reply, whatever goes wrong (an unknown day, a broken pool...), or the
+            # client would wait for it forever
+            try:
+                response = await self.run_job(job)
+            except Exception as e:
+                response = {'id': job.get('id'), 'error': f'{type(e).__name__}: {e}'}
+            async with write_lock:
+                writer.write(json.dumps(response, default=str).encode() + b'\n')
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                try:
+                    job = json.loads(line)
+                except json.JSONDecodeError:
+                    job = None
+                if not isinstance(job, dict):
+                    async with write_lock:
+                        writer.write(json.dumps({'error': f'Bad job: {line[:80]!r}'}).encode() + b'\n')
+                        await writer.drain()
+                    continue
+                task = asyncio.create_task(reply(job))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path=DAEMON_SOCKET, port=None):
+        """ Start the pool and serve until cancelled. Listens on 127.0.0.1:port if port is given,
+        otherwise on the Unix socket at socket_path.
+        """
+        import concurrent.futures
+
+        self.pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers, initializer=aoc_utils.warm_worker,
+                                                           initargs=(self.days, self.root))
+        # Make the workers start (and import everything) now rather than on the first job
+        await asyncio.gather(*[asyncio.get_running_loop().run_in_executor(self.pool, time.sleep, 0)
+                               for _ in range(self.workers)])
+        if port is not None:
+            server = await asyncio.start_server(self.handle_connection, '127.0.0.1', port, limit=MAX_JOB_BYTES)
+            where = f'127.0.0.1:{port}'
+        else:
+            if socket_path.exists():
+                socket_path.unlink()
+            server = await asyncio.start_unix_server(self.handle_connection, socket_path, limit=MAX_JOB_BYTES)
+            where = str(socket_path)
+        aoc_utils.console.print(f'[yellow]Serving[/] {len(self.days)} days with {self.workers} workers on {where}')
+        # Treat kill like ^C so the socket gets cleaned up
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            if port is None and socket_path.exists():
+                socket_path.unlink()
+
+
+def serve(workers=None, use_cache=True, socket_path=DAEMON_SOCKET, port=None):
+    """ Run a SolverDaemon until interrupted
+    """
+    try:
+        asyncio.run(SolverDaemon(workers, use_cache).serve(socket_path, port))
+    except KeyboardInterrupt:
+        pass
+
+
+class SolverClient:
+    """ A blocking connection to a running daemon. Keep one open to avoid reconnecting per job.
+    """
+
+    def __init__(self, socket_path=DAEMON_SOCKET, port=None):
+        if port is not None:
+            self.socket = socket.create_connection(('127.0.0.1', port))
+        else:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(str(socket_path))
+        self.file = self.socket.makefile('rb')
+        self.next_id = 0
+
+    def request(self, job):
+        """ Send one job (a dict, see the top of this file) and wait for its reply
+        """
+        self.next_id += 1
+        job = dict(job, id=self.next_id)
+        self.socket.sendall(json.dumps(job).encode() + b'\n')
+        return json.loads(self.file.readline())
+
+    def solve(self, day, part, input_text=None, path=None):
+        """ Solve part of day for input_text, or for the file at path
+        """
+        job = {'day': day, 'part': part}
+        if path is not None:
+            job['path'] = str(Path(path).resolve())
+        else:
+            job['input'] = input_text
+        return self.request(job)
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
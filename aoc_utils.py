@@ -1,36 +1,1610 @@
 from pathlib import Path
+import builtins
+import contextlib
+import contextvars
+import errno
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import math
+import mmap
+import os
+import pickle
+import re
+import sys
 import time
-from rich import print
-import rich.traceback
-rich.traceback.install(show_locals=True)
-from rich.panel import Panel
+import types
+# Heavier modules (numpy, statistics, concurrent.futures, ...) are imported in the functions that
+# need them so that they don't add to the startup time of every day.
 
-# console can be imported and used from other modules.
-from rich.console import Console
-console = Console()
 
+def env_flag(name):
+    """ Return True if the environment variable name is set to something other than '' or '0'
+    """
+    return os.environ.get(name, '') not in ('', '0')
+
+
+def headless_mode():
+    """ Return '' for normal (rich) output, 'text' or 'json'. Headless is chosen with the
+    AOC_HEADLESS environment variable (1, text or json) or --headless / --headless=json on the
+    command line. Headless runs never import rich, which is a big part of the startup time of the
+    quicker days.
+    """
+    mode = os.environ.get('AOC_HEADLESS', '')
+    for arg in sys.argv[1:]:
+        if arg == '--headless':
+            mode = 'text'
+        elif arg.startswith('--headless='):
+            mode = arg.split('=', 1)[1]
+    if mode in ('', '0'):
+        return ''
+    return 'json' if mode == 'json' else 'text'
+
+
+HEADLESS = headless_mode()
+
+
+class PlainConsole:
+    """ Stands in for rich's Console in headless mode, printing plain text with any rich markup
+    (e.g. [bold red]...[/]) stripped out.
+    """
+
+    MARKUP = re.compile(r'\[/?[a-z]*(?: [a-z]+)*\]')
+
+    def print(self, *objects, sep=' ', end='\n', **kwargs):
+        text = sep.join(str(o) for o in objects)
+        builtins.print(PlainConsole.MARKUP.sub('', text), end=end)
+
+    def rule(self, title='', **kwargs):
+        builtins.print(f'--- {PlainConsole.MARKUP.sub("", title)} ---')
+
+
+# console and print can be imported and used from other modules. Days use aoc_utils.print rather
+# than rich's so that they don't pull rich in when headless.
+if HEADLESS:
+    console = PlainConsole()
+    print = console.print
+else:
+    from rich import print
+    import rich.traceback
+    rich.traceback.install(show_locals=True)
+    from rich.panel import Panel
+    from rich.console import Console
+    console = Console()
+
+
+# Benchmark mode runs each part several times on the real input and reports statistics instead of
+# a single duration. It can be turned on for any day without editing it, e.g.
+#   AOC_BENCHMARK=1 AOC_BENCHMARK_REPEAT=50 ./day05.py
+BENCHMARK = env_flag('AOC_BENCHMARK')
+# Untimed runs before we start measuring, to warm up caches, lazy imports, etc.
+BENCHMARK_WARMUP = int(os.environ.get('AOC_BENCHMARK_WARMUP', 1))
+# Maximum number of timed runs per part
+BENCHMARK_REPEAT = int(os.environ.get('AOC_BENCHMARK_REPEAT', 20))
+# Stop repeating once this many seconds have been spent on a part (always at least one timed run)
+BENCHMARK_BUDGET = float(os.environ.get('AOC_BENCHMARK_BUDGET', 10))
+# Where the machine-readable results go. Results are merged into this file keyed by day and part.
+BENCHMARK_OUTPUT = Path(os.environ.get('AOC_BENCHMARK_OUTPUT', Path(__file__).parent / 'benchmark.json'))
+
+
+def summarize_durations(durations):
+    """ Take a list of durations in nanoseconds and return a dict of statistics about them.
+    """
+    import statistics
+
+    ordered = sorted(durations)
+    # Nearest-rank percentile
+    p95_i = max(0, -(-95 * len(ordered) // 100) - 1)
+    return {
+        'runs': len(ordered),
+        'min_ns': ordered[0],
+        'median_ns': int(statistics.median(ordered)),
+        'p95_ns': ordered[p95_i],
+        'mean_ns': int(statistics.fmean(ordered)),
+        'stddev_ns': int(statistics.stdev(ordered)) if len(ordered) > 1 else 0,
+    }
+
+
+def benchmark(the_func, get_data, warmup=BENCHMARK_WARMUP, repeat=BENCHMARK_REPEAT, budget=BENCHMARK_BUDGET):
+    """ Run the_func(get_data()) warmup times untimed, then time it repeat times or until budget seconds
+    have passed, whichever comes first. get_data is called outside the timer before every run, so
+    single use inputs like stream_lines can be recreated. Anything the_func prints is swallowed so it
+    doesn't flood the terminal. Returns (result, stats) where stats is from summarize_durations.
+    disk_cache is off for the runs, so they time the work rather than cache lookups.
+    """
+    with contextlib.redirect_stdout(io.StringIO()), cache_disabled():
+        for i in range(warmup):
+            the_func(get_data())
+        durations = []
+        deadline = time.perf_counter_ns() + int(budget * 1e9)
+        while len(durations) < repeat:
+            data = get_data()
+            start = time.perf_counter_ns()
+            result = the_func(data)
+            end = time.perf_counter_ns()
+            durations.append(end - start)
+            if end >= deadline:
+                break
+    return result, summarize_durations(durations)
+
+
+def write_benchmark_results(day, part, stats, output=BENCHMARK_OUTPUT):
+    """ Merge stats for the given day and part into the JSON file at output.
+    """
+    results = {}
+    if output.exists():
+        with output.open('r') as f:
+            results = json.load(f)
+    results.setdefault(day, {})[part] = stats
+    with output.open('w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+# AOC_INPUT_SIZE swaps the real input for a generated one of that size (see aoc_inputs), which is how
+# to see how a part scales, e.g.
+#   AOC_INPUT_SIZE=1000 AOC_BENCHMARK=1 ./day15.py
+# AOC_INPUT_SEED picks a different input of the same size.
+INPUT_SIZE = int(os.environ['AOC_INPUT_SIZE']) if os.environ.get('AOC_INPUT_SIZE') else None
+INPUT_SEED = int(os.environ.get('AOC_INPUT_SEED', 0))
+
+# Every timed run of a real or generated input (not cached lookups or profiled runs) is appended to a
+# SQLite database so timings survive the terminal scrolling, with enough context to compare them later:
+#   ./aoc.py compare --threshold 0.1
+# AOC_NO_HISTORY=1 turns this off, AOC_HISTORY_DB moves the database.
+HISTORY = not env_flag('AOC_NO_HISTORY')
+HISTORY_DB = Path(os.environ.get('AOC_HISTORY_DB', Path(__file__).parent / 'perf_history.sqlite'))
+
+
+@functools.cache
+def git_commit():
+    """ Return the commit the tree is at, with -dirty on the end if there are uncommitted changes
+    """
+    import subprocess
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty', '--abbrev=40'], cwd=Path(__file__).parent,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def history_connection(db=HISTORY_DB):
+    """ Open the history database, creating the table the first time
+    """
+    import sqlite3
+    # Several run-all workers may be writing at once, so wait for locks rather than failing
+    connection = sqlite3.connect(db, timeout=30)
+    connection.execute("""CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        git_commit TEXT NOT NULL,
+        day TEXT NOT NULL,
+        part TEXT NOT NULL,
+        input_hash TEXT NOT NULL,
+        wall_ns INTEGER NOT NULL,
+        peak_bytes INTEGER,
+        python_version TEXT NOT NULL,
+        mode TEXT NOT NULL)""")
+    connection.execute('CREATE INDEX IF NOT EXISTS runs_part ON runs (day, part, input_hash, mode)')
+    return connection
+
+
+def record_run(day, part, input_path, wall_ns, peak_bytes=None, mode='run', db=HISTORY_DB):
+    """ Append one timed run to the history database. mode is how it was timed: 'run' for a single
+    run, 'isolated' for a single run in its own worker process (with a timeout or memory limit),
+    'benchmark' (wall_ns is the fastest run) or 'memory' (under tracemalloc, with peak_bytes).
+    Runs are only ever compared with runs of the same mode.
+    """
+    import platform
+    with contextlib.closing(history_connection(db)) as connection, connection:
+        connection.execute('INSERT INTO runs (git_commit, day, part, input_hash, wall_ns, peak_bytes, python_version, '
+                           'mode) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                           (git_commit(), day, part, file_digest(input_path), wall_ns, peak_bytes,
+                            platform.python_version(), mode))
+
+
+def compare_history(threshold=0.1, baseline=None, current=None, db=HISTORY_DB):
+    """ Compare the fastest recorded time of every (day, part, input, mode) at the current commit
+    (default the one the tree is at) with its baseline: the given commit, or else the most recent other
+    commit with a run of the same thing. Returns a list of dicts, with regressed True where current
+    is more than threshold (a fraction) slower than baseline.
+    """
+    current = current or git_commit()
+    with contextlib.closing(history_connection(db)) as connection:
+        rows = connection.execute('SELECT day, part, input_hash, mode, git_commit, MIN(wall_ns), MAX(timestamp) '
+                                  'FROM runs GROUP BY day, part, input_hash, mode, git_commit '
+                                  'ORDER BY MAX(timestamp), MAX(id)').fetchall()
+    by_key = {}
+    for day, part, input_hash, mode, commit, wall_ns, _ in rows:
+        by_key.setdefault((day, part, input_hash, mode), {})[commit] = wall_ns
+    comparisons = []
+    for (day, part, input_hash, mode), commits in sorted(by_key.items()):
+        if current not in commits:
+            continue
+        if baseline is not None:
+            baseline_commit = baseline if baseline in commits else None
+        else:
+            # Dicts keep insertion order, which is oldest to newest
+            baseline_commit = next((c for c in reversed(commits) if c != current), None)
+        if baseline_commit is None:
+            continue
+        change = commits[current] / commits[baseline_commit] - 1
+        comparisons.append({'day': day, 'part': part, 'input_hash': input_hash, 'mode': mode,
+                            'baseline_commit': baseline_commit, 'baseline_ns': commits[baseline_commit],
+                            'current_ns': commits[current], 'change': change, 'regressed': change > threshold})
+    return comparisons
+
+
+# Complexity fitting times a part over a geometric series of generated input sizes (see aoc_inputs)
+# and finds the complexity class that best explains how the time grows, e.g.
+#   ./aoc.py complexity 07 b --start 250 --steps 6
+# Sizes are in the generator's units, so for the grid days (side length) O(n^2) means linear in cells.
+COMPLEXITY_CLASSES = {
+    'O(1)': lambda n: 1,
+    'O(log n)': lambda n: math.log2(n + 1),
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * math.log2(n + 1),
+    'O(n^2)': lambda n: n ** 2,
+    'O(n^2 log n)': lambda n: n ** 2 * math.log2(n + 1),
+    'O(n^3)': lambda n: n ** 3,
+    'O(2^n)': lambda n: 2.0 ** min(n, 1000),
+}
+
+
+def fit_complexity(sizes, durations):
+    """ Fit durations (ns) measured at sizes to each of COMPLEXITY_CLASSES as duration = c * f(size).
+    The fits are done on the logs so that the small sizes count as much as the big ones. Returns a
+    dict with best (the class with the smallest error), exponent (the slope of the log-log line, e.g.
+    about 2 for something quadratic), and fits, a list of (error, class, c) sorted best first.
+    """
+    log_t = [math.log(t) for t in durations]
+    fits = []
+    for name, f in COMPLEXITY_CLASSES.items():
+        log_f = [math.log(max(f(n), 1e-12)) for n in sizes]
+        # In log space the best c is just the mean offset
+        log_c = sum(t - lf for t, lf in zip(log_t, log_f)) / len(sizes)
+        error = math.sqrt(sum((t - lf - log_c) ** 2 for t, lf in zip(log_t, log_f)) / len(sizes))
+        fits.append((error, name, math.exp(log_c)))
+    fits.sort()
+    log_n = [math.log(n) for n in sizes]
+    mean_n = sum(log_n) / len(log_n)
+    mean_t = sum(log_t) / len(log_t)
+    spread = sum((n - mean_n) ** 2 for n in log_n)
+    exponent = sum((n - mean_n) * (t - mean_t) for n, t in zip(log_n, log_t)) / spread if spread else 0.0
+    return {'best': fits[0][1], 'exponent': exponent, 'fits': fits}
+
+
+def scaling_benchmark(day, part, sizes, seed=0, repeat=3, budget=BENCHMARK_BUDGET):
+    """ Time part ('a' or 'b') of day on a generated input of each of sizes in turn, taking the fastest
+    of up to repeat runs. Stops early once a size takes longer than budget seconds, since the next
+    one will only be worse. Returns a list of (size, stats) for the sizes that were run.
+    """
+    import aoc_inputs
+
+    the_day = load_day(day)
+    the_func, _, _ = the_day.part(part)
+    measurements = []
+    for size in sizes:
+        input_path = aoc_inputs.generated_input(day, size, seed)
+        get_data = data_getter(input_path, the_day.parse_input, the_day.input_mode)
+        _, stats = benchmark(the_func, get_data, warmup=0, repeat=repeat, budget=budget)
+        measurements.append((size, stats))
+        if stats['min_ns'] > budget * 1e9:
+            break
+    return measurements
+
+
+def differential(day, sizes, seed=0, repeat=3, budget=BENCHMARK_BUDGET):
+    """ Run each (reference, optimized) pair in day's differential_pairs on a generated input of each
+    of sizes, timing both (fastest of up to repeat runs). Returns a list of dicts, one per pair and
+    size, with both results, match (whether they agree), both times and the speedup of optimized
+    over reference. A pair stops growing once its reference takes longer than budget seconds.
+    """
+    import aoc_inputs
+
+    the_day = load_day(day)
+    reports = []
+    for reference, optimized in the_day.differential_pairs:
+        for size in sizes:
+            input_path = aoc_inputs.generated_input(day, size, seed)
+            get_data = data_getter(input_path, the_day.parse_input, the_day.input_mode)
+            reference_result, reference_stats = benchmark(reference, get_data, warmup=0, repeat=repeat, budget=budget)
+            optimized_result, optimized_stats = benchmark(optimized, get_data, warmup=0, repeat=repeat, budget=budget)
+            reports.append({
+                'reference': reference.__name__, 'optimized': optimized.__name__, 'size': size,
+                'reference_result': reference_result, 'optimized_result': optimized_result,
+                'match': reference_result == optimized_result,
+                'reference_ns': reference_stats['min_ns'], 'optimized_ns': optimized_stats['min_ns'],
+                'speedup': reference_stats['min_ns'] / optimized_stats['min_ns'],
+            })
+            if reference_stats['min_ns'] > budget * 1e9:
+                break
+    return reports
+
+
+def check_generated(day, sizes, parts=None, seed=0, timeout=30):
+    """ Run each of parts of day on a generated input of each of sizes, each in a worker that's killed
+    after timeout seconds, to catch generators that write inputs a solver never finishes (or fails) on.
+    parts defaults to both. Returns a list of run_input reports with the size added and a status of
+    'ok', 'error', or the PartFailure status if the worker was killed.
+    """
+    import aoc_inputs
+
+    reports = []
+    for size in sizes:
+        input_path = aoc_inputs.generated_input(day, size, seed)
+        for part in parts or PARTS:
+            try:
+                report = run_isolated(run_input, (day, part, input_path, ROOT, False, False), timeout)
+                report['status'] = 'error' if 'error' in report else 'ok'
+            except PartFailure as e:
+                report = {'day': day, 'part': part, 'input': str(input_path), 'error': str(e), 'status': e.status}
+            report['size'] = size
+            reports.append(report)
+    return reports
+
+
+# Days 01 and 02 also have Go ports (dayNN.go). Given an input file as their argument they print
+# "<part> <answer> <nanoseconds>" for each part, which lets us compare them with the Python, e.g.
+#   ./aoc.py cross-benchmark 01 --start 10000
+GO = os.environ.get('AOC_GO', 'go')
+GO_BUILD_DIR = Path(os.environ.get('AOC_GO_BUILD_DIR', Path(__file__).parent / '.aoc_go'))
+
+
+def go_binary(day):
+    """ Build day's Go port (if it changed since the last build) and return the path of the binary
+    """
+    import subprocess
+    source = load_day(day).dir / f'day{day}.go'
+    binary = GO_BUILD_DIR / f'day{day}'
+    if not binary.exists() or binary.stat().st_mtime < source.stat().st_mtime:
+        GO_BUILD_DIR.mkdir(parents=True, exist_ok=True)
+        subprocess.run([GO, 'build', '-o', binary, source.name], cwd=source.parent, check=True)
+    return binary
+
+
+def run_go(binary, input_path):
+    """ Run a Go port on input_path and return {part: (answer, nanoseconds)}
+    """
+    import subprocess
+    output = subprocess.run([binary, input_path], capture_output=True, text=True, check=True).stdout
+    results = {}
+    for line in output.splitlines():
+        part, answer, ns = line.split()
+        results[part] = (int(answer), int(ns))
+    return results
+
+
+def cross_benchmark(day, sizes, seed=0, repeat=5, budget=BENCHMARK_BUDGET):
+    """ Time the Python and Go versions of both parts of day on a generated input of each of sizes.
+    Both sides include reading the input but not process start up, and keep their fastest of repeat
+    runs. Returns a list of dicts per size and part with both answers, match, both times, both
+    throughputs (generated size units per second) and ratio, how many times faster Go is.
+    """
+    import aoc_inputs
+
+    the_day = load_day(day)
+    binary = go_binary(day)
+    reports = []
+    for size in sizes:
+        input_path = aoc_inputs.generated_input(day, size, seed)
+        go_runs = [run_go(binary, input_path) for _ in range(repeat)]
+        for part in PARTS:
+            the_func, _, _ = the_day.part(part)
+            python_result, stats = benchmark(the_func, data_getter(input_path, the_day.parse_input, the_day.input_mode),
+                                             warmup=1, repeat=repeat, budget=budget)
+            go_result = go_runs[0][part][0]
+            go_ns = min(run[part][1] for run in go_runs)
+            reports.append({
+                'part': part, 'size': size, 'python_result': python_result, 'go_result': go_result,
+                'match': python_result == go_result, 'python_ns': stats['min_ns'], 'go_ns': go_ns,
+                'python_per_second': size / (stats['min_ns'] / 1e9), 'go_per_second': size / (go_ns / 1e9),
+                'ratio': stats['min_ns'] / go_ns,
+            })
+    return reports
+
+
+# Profile mode runs each part on the real input under cProfile, e.g.
+#   AOC_PROFILE=1 ./day15.py
+# For each part it writes dayNN-part_x.pstats (load with pstats or snakeviz) and dayNN-part_x.collapsed
+# (collapsed stacks for flamegraph.pl, speedscope, etc.) to PROFILE_DIR and prints the hottest functions.
+PROFILE = env_flag('AOC_PROFILE')
+PROFILE_DIR = Path(os.environ.get('AOC_PROFILE_DIR', Path(__file__).parent / 'profiles'))
+# How many of the hottest functions to print
+PROFILE_TOP = int(os.environ.get('AOC_PROFILE_TOP', 15))
+
+
+def frame_label(func):
+    """ Return a readable name for a pstats function key (filename, line number, function name)
+    """
+    filename, line, name = func
+    if filename == '~':
+        # Built in, name is already something like <built-in method builtins.min>
+        return name
+    return f'{name} ({Path(filename).name}:{line})'
+
+
+def collapsed_stacks(stats, min_us=1):
+    """ Return {stack: microseconds} in the collapsed format used by flamegraph tools, where stack is
+    the frame labels from the outermost call inwards joined by ';'.
+    cProfile only records caller -> callee pairs, not whole stacks, so the stacks are rebuilt by
+    walking down from the outermost functions and splitting each callee's time between its callers
+    in proportion to how much time each caller spent in it (the same approach as flameprof).
+    Recursive calls are folded into the first occurrence of the function on the stack.
+    """
+    # callees[f] is {g: cumulative seconds g spent when called from f}
+    callees = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, caller_stats in callers.items():
+            callees.setdefault(caller, {})[func] = caller_stats[3]
+    roots = [func for func, (cc, nc, tt, ct, callers) in stats.stats.items() if not callers]
+    stacks = {}
+
+    def walk(func, path, seconds):
+        path = path + [func]
+        total_ct = stats.stats[func][3] or 1e-12
+        self_seconds = seconds
+        for callee, callee_ct in callees.get(func, {}).items():
+            if callee in path:
+                continue
+            # This path accounts for seconds out of func's total_ct, so gets that share of each callee
+            callee_seconds = callee_ct * seconds / total_ct
+            if callee_seconds * 1e6 >= min_us:
+                walk(callee, path, callee_seconds)
+            self_seconds -= callee_seconds
+        if self_seconds * 1e6 >= min_us:
+            stack = ';'.join(frame_label(f).replace(';', ',') for f in path)
+            stacks[stack] = stacks.get(stack, 0) + int(self_seconds * 1e6)
+
+    for root in roots:
+        walk(root, [], stats.stats[root][3])
+    return stacks
+
+
+def print_hot_functions(stats, top=PROFILE_TOP):
+    """ Print the top functions by time spent in the function itself (not counting its callees)
+    """
+    hottest = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    print('[yellow]Hottest functions:[/]')
+    print(f'  {"own":>10} {"cumulative":>10} {"calls":>9}  function')
+    for func, (cc, nc, tt, ct, callers) in hottest:
+        print(f'  {format_ns(int(tt * 1e9)):>10} {format_ns(int(ct * 1e9)):>10} {nc:>9}  {frame_label(func)}')
+
+
+def profile(the_func, data, output_stem, top=PROFILE_TOP):
+    """ Run the_func(data) under cProfile, write output_stem.pstats and output_stem.collapsed and
+    print the top hottest functions. Returns (result, duration_ns), the duration including the
+    profiler's overhead. disk_cache is off for the run.
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    with cache_disabled():
+        start = time.perf_counter_ns()
+        result = profiler.runcall(the_func, data)
+        duration = time.perf_counter_ns() - start
+    stats = pstats.Stats(profiler)
+    output_stem.parent.mkdir(parents=True, exist_ok=True)
+    stats.dump_stats(output_stem.with_suffix('.pstats'))
+    with output_stem.with_suffix('.collapsed').open('w') as f:
+        for stack, us in sorted(collapsed_stacks(stats).items()):
+            f.write(f'{stack} {us}\n')
+    print_hot_functions(stats, top)
+    print(f'[yellow]Profile written to:[/] {output_stem}.pstats and {output_stem.name}.collapsed')
+    return result, duration
+
+
+# Memory mode runs each part on the real input under tracemalloc and reports peak traced memory, the
+# change in the process's resident set size and the source lines that had allocated the most around
+# the peak, e.g.
+#   AOC_MEMORY=1 ./day06.py
+MEMORY = env_flag('AOC_MEMORY')
+# How many allocation sites to report
+MEMORY_TOP = int(os.environ.get('AOC_MEMORY_TOP', 10))
+
+
+def current_rss():
+    """ Return the resident set size of this process in bytes. Falls back to the peak RSS where
+    /proc isn't available.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (FileNotFoundError, ValueError, OSError):
+        import resource
+        # ru_maxrss is kilobytes on Linux but bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def measure_memory(the_func, data, top=MEMORY_TOP, sample_interval=0.005):
+    """ Run the_func(data) under tracemalloc. Returns (result, duration_ns, memory) where memory is a
+    dict with peak_bytes (peak traced Python allocations), rss_delta_bytes and top_allocations, a list
+    of {'site', 'bytes', 'count'} for the source lines holding the most memory.
+    Most of what a solver allocates has been freed by the time it returns, so a background thread
+    watches the traced total and takes a snapshot whenever it reaches a new high. The allocation sites
+    come from the snapshot closest to the peak. disk_cache is off for the run.
+    """
+    import threading
+    import tracemalloc
+
+    snapshots = {}
+    done = threading.Event()
+
+    def sample():
+        best = 0
+        while not done.wait(sample_interval):
+            current, peak = tracemalloc.get_traced_memory()
+            # Only re-snapshot on real growth, snapshots aren't free
+            if current > best * 1.05:
+                best = current
+                snapshots['peak'] = tracemalloc.take_snapshot()
+
+    rss_before = current_rss()
+    tracemalloc.start()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        with cache_disabled():
+            start = time.perf_counter_ns()
+            result = the_func(data)
+            duration = time.perf_counter_ns() - start
+        end_snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        done.set()
+        sampler.join()
+        tracemalloc.stop()
+    rss_after = current_rss()
+
+    snapshot = snapshots.get('peak', end_snapshot)
+    # Leave out allocations made by tracemalloc, the sampler thread and this module
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+    top_allocations = []
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        top_allocations.append({'site': f'{Path(frame.filename).name}:{frame.lineno}',
+                                'bytes': stat.size, 'count': stat.count})
+    memory = {
+        'peak_bytes': peak,
+        'rss_delta_bytes': rss_after - rss_before,
+        'top_allocations': top_allocations,
+    }
+    return result, duration, memory
+
+
+def print_memory(memory):
+    """ Print the dict returned by measure_memory
+    """
+    print(f'[yellow]Peak traced memory:[/] {format_bytes(memory["peak_bytes"])} '
+          f'[yellow]RSS delta:[/] {format_bytes(memory["rss_delta_bytes"])}')
+    print('[yellow]Largest allocation sites near the peak:[/]')
+    for allocation in memory['top_allocations']:
+        print(f'  {format_bytes(allocation["bytes"]):>10} {allocation["count"]:>9} blocks  {allocation["site"]}')
+
+
+def format_bytes(n):
+    """ Return a human readable version of a number of bytes (which may be negative)
+    """
+    for unit, scale in (('GB', 1 << 30), ('MB', 1 << 20), ('KB', 1 << 10)):
+        if abs(n) >= scale:
+            return f'{n / scale:.1f}{unit}'
+    return f'{n}B'
+
+
+def format_ns(ns):
+    """ Return a human readable version of a duration in nanoseconds
+    """
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('µs', 1e3)):
+        if ns >= scale:
+            return f'{ns / scale:.3f}{unit}'
+    return f'{ns}ns'
+
+
+def input_paths(path, day, sep_part_b_input=False):
+    """ Return the (test input, actual input) paths for day in directory path.
+    """
+    suffix = '-b' if sep_part_b_input else ''
+    return (path / f'day{day}-test{suffix}.txt', path / f'day{day}-input{suffix}.txt')
+
+
+def read_lines(input_path):
+    """ Return the stripped lines of the file at input_path
+    """
+    with input_path.open('r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def stream_lines(input_path):
+    """ Lazily yield the stripped lines of the file at input_path, reading them from a memory map
+    one at a time so memory use doesn't depend on the size of the file.
+    """
+    with input_path.open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Can't mmap an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                yield line.strip().decode()
+
+
+def read_buffer(input_path):
+    """ Return a read only memoryview of the whole file at input_path, backed by a memory map so
+    nothing is read until it's touched. The map is closed once the memoryview is garbage collected.
+    """
+    with input_path.open('rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+# How a day wants its input handed to it. A day opts in to something other than the default by
+# setting input_mode at module level and passing it to test_and_execute.
+#   lines  - list of stripped lines (read_lines)
+#   stream - lazy iterator of stripped lines (stream_lines), for inputs too big for memory
+#   buffer - memoryview of the raw bytes (read_buffer)
+INPUT_READERS = {
+    'lines': read_lines,
+    'stream': stream_lines,
+    'buffer': read_buffer,
+}
+
+
+# Fast input parsing. Calling parse.parse(format, line) on every line re-interprets the format each
+# time, which is by far the slowest part of reading the bigger inputs. LineFormat compiles a format
+# once, and scan_ints pulls every integer out of a whole input with numpy and no per-line Python.
+
+class LineFormat:
+    """ A format in the style of the parse library, e.g. '{x1:d},{y1:d} -> {x2:d},{y2:d}', compiled
+    once into a regular expression. Supported field types are d and n (integers), l (letters),
+    w (word characters) and none (any text). Field names are allowed but ignored, results are tuples
+    in field order.
+    """
+
+    FIELD = re.compile(r'\{\w*(?::(\w))?\}')
+    TYPES = {
+        'd': (r'[-+]?\d+', int),
+        'n': (r'[-+]?\d+', int),
+        'l': (r'[A-Za-z]+', str),
+        'w': (r'\w+', str),
+        None: (r'.+?', str),
+    }
+
+    def __init__(self, fmt):
+        self.fmt = fmt
+        pattern = ''
+        self.converters = []
+        last = 0
+        for field in LineFormat.FIELD.finditer(fmt):
+            field_pattern, converter = LineFormat.TYPES[field.group(1)]
+            pattern += re.escape(fmt[last:field.start()]) + f'({field_pattern})'
+            self.converters.append(converter)
+            last = field.end()
+        pattern += re.escape(fmt[last:])
+        self.regex = re.compile(pattern)
+        self.line_regex = re.compile(f'^{pattern}$', re.MULTILINE)
+
+    def _convert(self, match):
+        return tuple(convert(value) for convert, value in zip(self.converters, match.groups()))
+
+    def parse(self, line):
+        """ Return a tuple of the fields in line, or None if it doesn't match.
+        """
+        match = self.regex.fullmatch(line)
+        return None if match is None else self._convert(match)
+
+    def parse_all(self, text):
+        """ Return a list with a tuple of fields for every matching line of text, which can be a str,
+        bytes, a memoryview (e.g. from read_buffer) or a list of lines. The whole input is searched
+        with one regular expression.
+        """
+        if isinstance(text, list):
+            text = '\n'.join(text)
+        elif not isinstance(text, str):
+            text = bytes(text).decode()
+        return [self._convert(match) for match in self.line_regex.finditer(text)]
+
+    def __repr__(self):
+        return f'LineFormat({self.fmt!r})'
+
+
+def scan_ints(text, columns=None):
+    """ Return a numpy int64 array of every integer in text, in order. text can be a str, bytes, a
+    memoryview (e.g. from read_buffer) or a list of lines. A '-' immediately before the digits makes
+    the number negative. If columns is given the array is reshaped to have that many columns, e.g.
+    4 for each x1,y1 -> x2,y2 line of day05.
+
+    This is a vectorized digit scanner: find the runs of digit bytes, then build all the numbers at
+    once one digit position at a time (Horner's method), so the cost is a handful of numpy passes
+    over the buffer rather than a Python int() per number.
+    """
+    import numpy as np
+
+    if isinstance(text, list):
+        text = '\n'.join(text)
+    if isinstance(text, str):
+        text = text.encode()
+    a = np.frombuffer(text, dtype=np.uint8)
+    # Bytes that aren't digits wrap around to values >= 10
+    digits = a - np.uint8(ord('0'))
+    is_digit = digits < 10
+    padded = np.zeros(len(a) + 2, dtype=bool)
+    padded[1:-1] = is_digit
+    starts = np.flatnonzero(is_digit & ~padded[:-2])
+    ends = np.flatnonzero(is_digit & ~padded[2:]) + 1
+    if len(starts) == 0:
+        values = np.zeros(0, dtype=np.int64)
+    else:
+        lengths = ends - starts
+        values = digits[starts].astype(np.int64)
+        last = len(a) - 1
+        for k in range(1, lengths.max()):
+            next_digits = digits[np.minimum(starts + k, last)]
+            values = np.where(lengths > k, values * 10 + next_digits, values)
+        values[(a[starts - 1] == ord('-')) & (starts > 0)] *= -1
+    if columns is not None:
+        values = values.reshape(-1, columns)
+    return values
+
+
+# How much of an input scan_int_chunks and map_chunks handle at once
+SCAN_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def whitespace_ints(text):
+    """ Return a numpy int64 array of the integers in text (str, bytes or a numpy uint8 array), which must
+    be nothing but integers separated by whitespace, e.g. one per line. That's numpy's own parser, written
+    in C, so it's several times quicker than scan_ints on the inputs it can read.
+    """
+    import numpy as np
+
+    if isinstance(text, np.ndarray):
+        text = text.tobytes()
+    return np.fromstring(text, dtype=np.int64, sep=' ')
+
+
+def line_chunks(buffer, chunk_bytes=SCAN_CHUNK_BYTES):
+    """ Yield (start, end) offsets that split buffer (bytes, a memoryview or a numpy uint8 array) into
+    pieces of about chunk_bytes that each end at the end of a line, so no line is split between two.
+    """
+    import numpy as np
+
+    a = np.frombuffer(buffer, dtype=np.uint8)
+    start = 0
+    while start < len(a):
+        end = min(start + chunk_bytes, len(a))
+        # Move on to just past the next newline
+        while end < len(a) and a[end - 1] != ord('\n'):
+            newlines = np.flatnonzero(a[end:end + 4096] == ord('\n'))
+            end = end + int(newlines[0]) + 1 if len(newlines) else min(end + 4096, len(a))
+        yield start, end
+        start = end
+
+
+def scan_int_chunks(buffer, chunk_bytes=SCAN_CHUNK_BYTES, scan=scan_ints):
+    """ Yield scan(piece) (scan_ints, or whitespace_ints if the input suits it) of each piece of buffer
+    (bytes or a memoryview, e.g. from read_buffer) from line_chunks, so no number is split and an input of
+    any size is scanned in a fixed amount of memory.
+    """
+    import numpy as np
+
+    a = np.frombuffer(buffer, dtype=np.uint8)
+    for start, end in line_chunks(a, chunk_bytes):
+        yield scan(a[start:end])
+
+
+# What map_chunks hands its worker processes, set when they're forked
+_chunk_buffer = None
+_chunk_func = None
+
+
+def _init_chunk_worker(buffer, func):
+    global _chunk_buffer, _chunk_func
+    _chunk_buffer, _chunk_func = buffer, func
+
+
+def _map_chunk(start, end):
+    return _chunk_func(_chunk_buffer[start:end])
+
+
+def map_chunks(buffer, func, workers=None, chunk_bytes=SCAN_CHUNK_BYTES):
+    """ Return [func(piece) for each piece of buffer from line_chunks], in order, where each piece is a numpy
+    uint8 array of whole lines. This is the map half of a map-reduce: func should boil its piece down to
+    something small, which the caller combines.
+    If there's more than one piece and more than one core the pieces are shared out over a pool of workers
+    (default one per core). The workers are forked, so they share buffer (and func, which needn't be
+    picklable) rather than having them copied to them. Only the pieces' offsets and func's results travel
+    between processes.
+    """
+    import multiprocessing
+    import numpy as np
+
+    a = np.frombuffer(buffer, dtype=np.uint8)
+    chunks = list(line_chunks(a, chunk_bytes))
+    workers = min(workers or os.cpu_count(), len(chunks))
+    # Daemon processes (e.g. Pebble's, see isolated_pool) can't start a pool of their own
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        return [func(a[start:end]) for start, end in chunks]
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'),
+                                                initializer=_init_chunk_worker, initargs=(a, func)) as pool:
+        return list(pool.map(_map_chunk, *zip(*chunks)))
+
+
+# Offsets of the 4 and 8 neighbours of a grid cell, as (row, col)
+OFFSETS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+OFFSETS_8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+# Neighbour tables kept for reuse. A 1000x1000 table is ~61MB, and long lived workers (run_batch, the
+# daemon) see lots of grid shapes, so only the most recently used few are kept.
+NEIGHBOR_TABLES_MAX = 8
+
+
+@functools.lru_cache(maxsize=NEIGHBOR_TABLES_MAX)
+def neighbor_table(height, width, diagonal=False):
+    """ Return a (height * width, 4) array (8 if diagonal) of the flat indices of each cell's neighbours,
+    -1 where the neighbour would be off the grid. Shared by the grids of the same shape, so don't modify it.
+    """
+    import numpy as np
+
+    rows, cols = np.divmod(np.arange(height * width), width)
+    offsets = OFFSETS_8 if diagonal else OFFSETS_4
+    table = np.empty((height * width, len(offsets)), dtype=np.int64)
+    for i, (dr, dc) in enumerate(offsets):
+        r, c = rows + dr, cols + dc
+        table[:, i] = np.where((r >= 0) & (r < height) & (c >= 0) & (c < width), r * width + c, -1)
+    table.flags.writeable = False
+    return table
+
+
+class Grid:
+    """ A rectangular grid of integers (heights, energies, risks, pixels...) stored as one flat numpy
+    array in row major order, so cell (row, col) is index row * width + col. Neighbours come from tables
+    shared by every grid of the same shape rather than being worked out cell by cell.
+    """
+
+    def __init__(self, cells, width):
+        """ cells is anything numpy can turn into an array of height * width values (or height rows)
+        """
+        import numpy as np
+
+        self.cells = np.ascontiguousarray(cells, dtype=np.int64).reshape(-1)
+        self.width = width
+        self.height = len(self.cells) // width
+
+    @classmethod
+    def from_lines(cls, lines, values=None):
+        """ Make a Grid from lines of digits, or of characters mapped to numbers by values, e.g.
+        {'#': 1, '.': 0}. Blank lines are ignored.
+        """
+        import numpy as np
+
+        lines = [line for line in lines if line]
+        raw = np.frombuffer(''.join(lines).encode(), dtype=np.uint8)
+        if values is None:
+            cells = raw - ord('0')
+        else:
+            table = np.zeros(256, dtype=np.int64)
+            for char, value in values.items():
+                table[ord(char)] = value
+            cells = table[raw]
+        return cls(cells, len(lines[0]))
+
+    def __repr__(self):
+        return f'Grid({self.height}x{self.width})'
+
+    def __len__(self):
+        return len(self.cells)
+
+    @property
+    def shape(self):
+        return (self.height, self.width)
+
+    def rows(self):
+        """ Return the cells as a (height, width) view, changes to it change the grid
+        """
+        return self.cells.reshape(self.height, self.width)
+
+    def index(self, row, col):
+        return row * self.width + col
+
+    def coords(self, index):
+        """ Return (row, col) of the cell at flat index
+        """
+        return divmod(index, self.width)
+
+    def neighbor_table(self, diagonal=False):
+        """ See neighbor_table
+        """
+        return neighbor_table(self.height, self.width, diagonal)
+
+    def neighbor_values(self, diagonal=False, fill=0):
+        """ Return a (cells, 4) array (8 if diagonal) of the values of each cell's neighbours, with fill
+        standing in for the ones off the grid.
+        """
+        import numpy as np
 
-def test_and_execute(the_func, day=None, test_assertion=None, path=Path(__file__), sep_part_b_input=False):
+        table = self.neighbor_table(diagonal)
+        return np.where(table >= 0, self.cells[table], fill)
+
+    def local_minima(self, diagonal=False):
+        """ Return an array of the indices of the cells lower than all of their neighbours
+        """
+        import numpy as np
+
+        fill = np.iinfo(self.cells.dtype).max
+        return np.flatnonzero((self.cells[:, None] < self.neighbor_values(diagonal, fill)).all(axis=1))
+
+    def convolve(self, kernel, fill=0):
+        """ Return a new Grid the same shape where each cell is the sum of the window of cells around it
+        (the same shape as kernel, which must have odd sides) multiplied by kernel, with fill for cells
+        off the grid. E.g. a 3x3 of ones with a zero in the middle counts each cell's neighbours that
+        are 1, and [[256, 128, 64], [32, 16, 8], [4, 2, 1]] reads each 3x3 window as a binary number.
+        """
+        import numpy as np
+
+        kernel = np.asarray(kernel)
+        pad_rows, pad_cols = kernel.shape[0] // 2, kernel.shape[1] // 2
+        padded = np.pad(self.rows(), ((pad_rows, pad_rows), (pad_cols, pad_cols)), constant_values=fill)
+        result = np.zeros(self.shape, dtype=np.int64)
+        for (dr, dc), weight in np.ndenumerate(kernel):
+            if weight:
+                result += weight * padded[dr:dr + self.height, dc:dc + self.width]
+        return Grid(result, self.width)
+
+    def pad(self, n, fill=0):
+        """ Return a new Grid with n extra rows and columns of fill on every side
+        """
+        import numpy as np
+
+        return Grid(np.pad(self.rows(), n, constant_values=fill), self.width + 2 * n)
+
+    def tile(self, rows, cols):
+        """ Return a new Grid of rows x cols copies of this one
+        """
+        import numpy as np
+
+        return Grid(np.tile(self.rows(), (rows, cols)), self.width * cols)
+
+    def copy(self):
+        return Grid(self.cells.copy(), self.width)
+
+
+# Points are packed into one int64 as x << 32 | (y + POINT_BIAS), so x and y can each be any 32 bit signed
+# value and the keys sort by x then y
+POINT_BIAS = 1 << 31
+
+
+def pack_points(xs, ys):
+    """ Return the packed int64 keys of the points with coordinates xs and ys (arrays or ints). Packed keys
+    also make good dict keys, they hash far quicker than tuples and are a quarter of the size.
+    """
+    import numpy as np
+
+    return (np.asarray(xs, dtype=np.int64) << 32) | (np.asarray(ys, dtype=np.int64) + POINT_BIAS)
+
+
+def unpack_points(keys):
+    """ Return (xs, ys), the coordinates of packed keys
+    """
+    import numpy as np
+
+    keys = np.asarray(keys, dtype=np.int64)
+    return keys >> 32, (keys & 0xFFFFFFFF) - POINT_BIAS
+
+
+class PointSet:
+    """ A set of (x, y) points held as a sorted numpy array of packed keys, 8 bytes a point rather than
+    the hundred or so of a tuple in a set. Set operations and transforms work on all the points at once,
+    so build a new set per step (a fold, a move...) rather than adding points one at a time.
+    """
+
+    def __init__(self, keys=()):
+        """ keys are packed keys, see pack_points. Use from_points to start from coordinates.
+        """
+        import numpy as np
+
+        self.keys = np.unique(np.asarray(keys, dtype=np.int64))
+
+    @classmethod
+    def from_points(cls, xs, ys):
+        return cls(pack_points(xs, ys))
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """ Make a PointSet from an iterable of (x, y)
+        """
+        import numpy as np
+
+        pairs = np.array(list(pairs), dtype=np.int64).reshape(-1, 2)
+        return cls.from_points(pairs[:, 0], pairs[:, 1])
+
+    def __repr__(self):
+        return f'PointSet({len(self)} points)'
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        """ Yield each point as an (x, y) tuple, in x then y order
+        """
+        xs, ys = self.xy()
+        return zip(xs.tolist(), ys.tolist())
+
+    def __contains__(self, point):
+        key = int(pack_points(*point))
+        i = self.keys.searchsorted(key)
+        return i < len(self.keys) and self.keys[i] == key
+
+    def __eq__(self, other):
+        return isinstance(other, PointSet) and len(self) == len(other) and bool((self.keys == other.keys).all())
+
+    def __or__(self, other):
+        import numpy as np
+
+        return PointSet(np.union1d(self.keys, other.keys))
+
+    def __and__(self, other):
+        import numpy as np
+
+        return PointSet(np.intersect1d(self.keys, other.keys, assume_unique=True))
+
+    def __sub__(self, other):
+        import numpy as np
+
+        return PointSet(np.setdiff1d(self.keys, other.keys, assume_unique=True))
+
+    def __xor__(self, other):
+        import numpy as np
+
+        return PointSet(np.setxor1d(self.keys, other.keys, assume_unique=True))
+
+    def xy(self):
+        """ Return (xs, ys), arrays of the coordinates of the points
+        """
+        return unpack_points(self.keys)
+
+    def transform(self, func):
+        """ Return a new PointSet of func(xs, ys), which takes and returns arrays of coordinates. Points
+        that land on the same spot merge.
+        """
+        return PointSet.from_points(*func(*self.xy()))
+
+    def select(self, func):
+        """ Return a new PointSet of the points where func(xs, ys) (a boolean array) is True
+        """
+        return PointSet(self.keys[func(*self.xy())])
+
+    def bounds(self):
+        """ Return (min_x, min_y, max_x, max_y)
+        """
+        xs, ys = self.xy()
+        return int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
+
+    def to_grid(self):
+        """ Return a Grid bitmap of the points' bounding box, from (0, 0) or the lowest point if that's
+        negative, with 1 where there's a point. Rows are y and columns are x.
+        """
+        import numpy as np
+
+        min_x, min_y, max_x, max_y = self.bounds()
+        min_x, min_y = min(min_x, 0), min(min_y, 0)
+        width = max_x - min_x + 1
+        cells = np.zeros((max_y - min_y + 1) * width, dtype=np.int64)
+        xs, ys = self.xy()
+        cells[(ys - min_y) * width + xs - min_x] = 1
+        return Grid(cells, width)
+
+
+def file_digest(input_path):
+    """ Return the sha256 hex digest of the file at input_path, reading it in chunks.
+    """
+    with input_path.open('rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+# A day can define parse_input(lines) and pass it to test_and_execute. Its result is computed once
+# per input file and handed to both part_a and part_b in place of the lines, so the parts must treat
+# it as read only. Keyed on (parse_input, input path, its mtime and size). Only the most recent few are kept, so that a
+# long lived worker going through lots of inputs (see run_batch) doesn't hold on to all of them.
+_parsed_inputs = {}
+PARSED_INPUTS_MAX = 8
+
+
+def load_input(input_path, parse_input=None, input_mode='lines'):
+    """ Return (data, parse_ns) for input_path. data is the input as given by INPUT_READERS[input_mode],
+    or the result of parse_input on that if given. parse_ns is how long parse_input took, or None if
+    it wasn't called because there's no hook or this input was already parsed.
+    """
+    if parse_input is None:
+        return INPUT_READERS[input_mode](input_path), None
+    # Editing or regenerating the file changes its mtime or size, so it gets parsed again
+    stat = input_path.stat()
+    key = (parse_input, input_path.resolve(), stat.st_mtime_ns, stat.st_size)
+    if key in _parsed_inputs:
+        return _parsed_inputs[key], None
+    lines = INPUT_READERS[input_mode](input_path)
+    start = time.perf_counter_ns()
+    data = _parsed_inputs[key] = parse_input(lines)
+    parse_ns = time.perf_counter_ns() - start
+    while len(_parsed_inputs) > PARSED_INPUTS_MAX:
+        # Dicts are in insertion order, so this is the oldest
+        del _parsed_inputs[next(iter(_parsed_inputs))]
+    return data, parse_ns
+
+
+# The result cache. Solved parts are stored on disk keyed on a hash of the input file, the solver's
+# source and its parameters, so re-running a day that hasn't changed is instant. Set AOC_NO_CACHE=1
+# to bypass it. Benchmark, profile and memory runs never use it, and nor does anything run inside them or
+# inside a solve with use_cache=False, including helpers decorated with disk_cache (see cache_disabled).
+CACHE_DIR = Path(os.environ.get('AOC_CACHE_DIR', Path(__file__).parent / '.aoc_cache'))
+# Once the cache grows beyond this many bytes the least recently used entries are thrown out
+CACHE_MAX_BYTES = int(os.environ.get('AOC_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+
+class ResultCache:
+    """ A size bounded, least recently used, on-disk cache of pickled values. Each entry is a file
+    named for its key. Recency is tracked with the file's modification time.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, enabled=True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+    @staticmethod
+    def key(*parts):
+        """ Return a hex digest identifying parts, which are bytes or strings
+        """
+        h = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode()
+            # Length prefix so ('ab', 'c') and ('a', 'bc') don't collide
+            h.update(len(part).to_bytes(8, 'little'))
+            h.update(part)
+        return h.hexdigest()
+
+    def _path(self, key):
+        return self.directory / f'{key}.pickle'
+
+    def get(self, key):
+        """ Return the value stored for key, or None if there isn't one.
+        """
+        path = self._path(key)
+        try:
+            with path.open('rb') as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        # Mark as recently used
+        os.utime(path)
+        return value
+
+    def put(self, key, value):
+        """ Store value for key, then evict old entries if we're over max_bytes.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # Write to a temporary name and rename so a concurrent reader never sees half a file
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump(value, f)
+        tmp_path.replace(path)
+        self.evict()
+
+    def evict(self):
+        """ Delete least recently used entries until the cache fits within max_bytes.
+        """
+        entries = []
+        for path in self.directory.glob('*.pickle'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob('*.pickle'):
+            path.unlink(missing_ok=True)
+
+
+CACHE = ResultCache(enabled=not env_flag('AOC_NO_CACHE'))
+
+
+@functools.cache
+def _is_project_file(filename):
+    """ Return True if filename is one of our shared modules (aoc_utils, aoc_search, ...) at the top of the repo
+    """
+    return Path(filename).resolve().parent == Path(__file__).resolve().parent
+
+
+@functools.cache
+def _source_digest(filename, mtime_ns, size):
+    """ Return the sha256 of filename's source, remembered for as long as its mtime and size don't change
+    """
+    return hashlib.sha256(Path(filename).read_bytes()).hexdigest()
+
+
+def project_imports(namespace, found=None):
+    """ Return the set of filenames of the shared project modules that namespace (a module's globals)
+    uses, either imported whole or by importing something from them, and the ones those use in turn.
+    """
+    found = set() if found is None else found
+    for value in list(namespace.values()):
+        if isinstance(value, types.ModuleType):
+            module = value
+        else:
+            module_name = getattr(value, '__module__', None)
+            module = sys.modules.get(module_name) if isinstance(module_name, str) else None
+        filename = getattr(module, '__file__', None)
+        if filename and filename not in found and _is_project_file(filename):
+            found.add(filename)
+            project_imports(vars(module), found)
+    return found
+
+
+def solver_fingerprint(the_func):
+    """ Return a string that changes whenever the_func would compute something different for the
+    same input: the source of the module it lives in (which covers any helpers in it), digests of
+    the shared project modules it uses (aoc_utils, aoc_search, ...), its name and the default values
+    of its parameters (e.g. num_days in day06, n in day20).
+    """
+    # Avoiding inspect here keeps it out of the startup cost of every day
+    module_source = Path(the_func.__code__.co_filename).read_text()
+    helpers = []
+    for filename in sorted(project_imports(the_func.__globals__)):
+        stat = os.stat(filename)
+        helpers.append(f'{Path(filename).name}:{_source_digest(filename, stat.st_mtime_ns, stat.st_size)}')
+    defaults = (the_func.__defaults__, the_func.__kwdefaults__)
+    return f'{module_source}\0{" ".join(helpers)}\0{the_func.__qualname__}\0{defaults!r}'
+
+
+# False while a run that mustn't be answered from the cache is going, see cache_disabled
+_disk_cache_enabled = contextvars.ContextVar('disk_cache_enabled', default=True)
+
+
+@contextlib.contextmanager
+def cache_disabled():
+    """ Make disk_cache call straight through to the function it wraps for the duration of the with block.
+    solve uses it when use_cache is False, and benchmark, profile and measure_memory always do, so
+    they time and measure the work rather than a pickle load.
+    """
+    token = _disk_cache_enabled.set(False)
+    try:
+        yield
+    finally:
+        _disk_cache_enabled.reset(token)
+
+
+def disk_cache(the_func):
+    """ Decorator that memoizes the_func in CACHE, keyed on solver_fingerprint and the arguments.
+    Use this for expensive work that part_a and part_b share, the results then survive across runs
+    and processes. Arguments must have a stable repr. Does nothing inside cache_disabled.
+    """
+    @functools.wraps(the_func)
+    def wrapper(*args, **kwargs):
+        if not (CACHE.enabled and _disk_cache_enabled.get()):
+            return the_func(*args, **kwargs)
+        key = CACHE.key(solver_fingerprint(the_func), repr(args), repr(sorted(kwargs.items())))
+        hit = CACHE.get(key)
+        if hit is not None:
+            return hit[0]
+        result = the_func(*args, **kwargs)
+        CACHE.put(key, (result,))
+        return result
+    return wrapper
+
+
+def solve(the_func, input_path, use_cache=True, parse_input=None, input_mode='lines'):
+    """ Run the_func on input_path (see load_input) and return (result, duration_ns, cached, parse_ns).
+    duration_ns doesn't include parsing, parse_ns is from load_input.
+    If use_cache then a previously stored result is returned when there is one (cached is True and
+    duration_ns is how long the lookup took). Anything the_func printed when it originally ran is
+    stored with the result and printed again on a hit, e.g. the letters drawn by day13 part_b.
+    """
+    if not (use_cache and CACHE.enabled):
+        data, parse_ns = load_input(input_path, parse_input, input_mode)
+        with cache_disabled():
+            start = time.perf_counter_ns()
+            result = the_func(data)
+            duration = time.perf_counter_ns() - start
+        return result, duration, False, parse_ns
+
+    start = time.perf_counter_ns()
+    key = CACHE.key(file_digest(input_path), solver_fingerprint(the_func))
+    hit = CACHE.get(key)
+    if hit is not None:
+        result, output = hit
+        sys.stdout.write(output)
+        return result, time.perf_counter_ns() - start, True, None
+    data, parse_ns = load_input(input_path, parse_input, input_mode)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter_ns()
+        result = the_func(data)
+        duration = time.perf_counter_ns() - start
+    sys.stdout.write(output.getvalue())
+    CACHE.put(key, (result, output.getvalue()))
+    return result, duration, False, parse_ns
+
+
+# Isolation runs each part in its own worker process (a Pebble pool) which is killed if it takes more
+# than AOC_TIMEOUT seconds, and can't allocate more than AOC_MEMORY_LIMIT (e.g. 2G or 512M). A part that
+# goes pathological is then reported as such instead of hanging everything after it, e.g.
+#   AOC_TIMEOUT=30 AOC_MEMORY_LIMIT=2G ./day22.py
+
+
+def parse_size(size):
+    """ Turn a size like 512M, 2G or 1000000 into a number of bytes
+    """
+    size = size.strip().upper().removesuffix('B')
+    scale = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}.get(size[-1:], 1)
+    return int(float(size.rstrip('KMG') or 0) * scale)
+
+
+TIMEOUT = float(os.environ.get('AOC_TIMEOUT', 0)) or None
+MEMORY_LIMIT = parse_size(os.environ.get('AOC_MEMORY_LIMIT', '0')) or None
+
+
+class PartFailure(Exception):
+    """ An isolated part that didn't produce a result. status is 'timeout', 'memory' or 'died'.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def address_space():
+    """ Return the size of this process's address space in bytes, or 0 where /proc can't tell us
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmSize:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def is_out_of_memory(e):
+    """ Return True if the exception e (or one it was raised from) means an allocation was refused.
+    Allocations that go through mmap (e.g. read_buffer) raise OSError ENOMEM rather than MemoryError, and
+    an extension module that can't be mapped in (e.g. numpy's, imported lazily) fails with an ImportError.
+    """
+    while e is not None:
+        if isinstance(e, MemoryError) or (isinstance(e, OSError) and e.errno == errno.ENOMEM):
+            return True
+        if isinstance(e, ImportError) and 'failed to map segment' in str(e):
+            return True
+        e = e.__cause__ or e.__context__
+    return False
+
+
+def limit_memory(memory_limit):
+    """ Worker initializer that caps the address space of the worker process. RLIMIT_AS counts everything
+    mapped, including what the worker inherited from the process it was forked from (the interpreter,
+    numpy, ...), so the cap is memory_limit on top of the worker's address space when it starts.
+    """
+    if memory_limit:
+        import resource
+        limit = address_space() + memory_limit
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def isolated_worker(memory_limit):
+    """ Initializer for isolated_pool's workers. Does the WARM_IMPORTS before anything is timed (or
+    they'd be counted in the first part's duration every time), then caps the worker's memory.
+    """
+    warm_imports()
+    limit_memory(memory_limit)
+
+
+def isolated_pool(workers=1, memory_limit=MEMORY_LIMIT):
+    """ Return a Pebble process pool of warmed workers capped at memory_limit bytes
+    """
+    import pebble
+    return pebble.ProcessPool(max_workers=workers, initializer=isolated_worker, initargs=(memory_limit,))
+
+
+def wait_isolated(future, timeout=TIMEOUT, memory_limit=MEMORY_LIMIT):
+    """ Return the result of a future from isolated_pool, raising PartFailure if it timed out, ran
+    out of memory or the worker died (e.g. killed by the kernel).
+    """
+    import concurrent.futures
+    import pebble
+    try:
+        return future.result()
+    except concurrent.futures.TimeoutError:
+        raise PartFailure('timeout', f'timed out after {timeout:g}s') from None
+    except pebble.ProcessExpired as e:
+        raise PartFailure('died', f'worker process died with exit code {e.exitcode}') from None
+    except Exception as e:
+        if not is_out_of_memory(e):
+            raise
+        raise PartFailure('memory', f'ran out of memory (limit {format_bytes(memory_limit)})') from None
+
+
+def _call_flushed(the_func, *args):
+    """ Call the_func in a worker, making sure whatever it printed comes out before we return
+    """
+    try:
+        return the_func(*args)
+    finally:
+        sys.stdout.flush()
+
+
+def run_isolated(the_func, args, timeout=TIMEOUT, memory_limit=MEMORY_LIMIT):
+    """ Call the_func(*args) in a fresh worker process and return its result. Raises PartFailure if
+    it takes longer than timeout seconds or needs more than memory_limit bytes.
+    """
+    # Anything still buffered would be written again by the forked worker
+    sys.stdout.flush()
+    with isolated_pool(1, memory_limit) as pool:
+        future = pool.schedule(_call_flushed, (the_func, *args), timeout=timeout)
+        return wait_isolated(future, timeout, memory_limit)
+
+
+def data_getter(input_path, parse_input=None, input_mode='lines'):
+    """ Return a function that returns the data for input_path (see load_input) each time it's called,
+    for repeated runs such as benchmarks.
+    """
+    if input_mode == 'lines' or parse_input is not None:
+        data, _ = load_input(input_path, parse_input, input_mode)
+        return lambda: data
+    # Streams and buffers are used up or closed by a run, so make a new one each time
+    return lambda: load_input(input_path, parse_input, input_mode)[0]
+
+
+def test_and_execute(the_func, day=None, test_assertion=None, path=Path(__file__), sep_part_b_input=False,
+                     benchmark_mode=None, use_cache=True, parse_input=None, input_mode='lines', profile_mode=None,
+                     memory_mode=None, timeout=None, memory_limit=None, input_size=None, input_seed=None,
+                     history=None):
     """ Run the_func for both test and actual inputs, comparing
     the results from the test run with test_assertion.
-    Prints results.    
+    Prints results.
+    If benchmark_mode (defaults to the AOC_BENCHMARK environment variable) then the actual input
+    is run repeatedly and statistics are printed and written to BENCHMARK_OUTPUT.
+    Results are looked up in and saved to CACHE unless use_cache is False, AOC_NO_CACHE is set or
+    we are benchmarking.
+    If parse_input is given it is called once per input file and its result is passed to the_func
+    instead of the lines (see load_input).
+    input_mode selects how the input is read, see INPUT_READERS.
+    If profile_mode (defaults to the AOC_PROFILE environment variable) then the actual input is run
+    under cProfile, see profile. This also bypasses the cache.
+    If memory_mode (defaults to the AOC_MEMORY environment variable) then the actual input is run
+    under tracemalloc, see measure_memory. This also bypasses the cache.
+    If timeout (seconds, defaults to AOC_TIMEOUT) or memory_limit (bytes, defaults to
+    AOC_MEMORY_LIMIT) is set then each input is solved in its own worker process, see run_isolated.
+    A part that times out or runs out of memory is reported and recorded rather than raised.
+    If input_size (defaults to AOC_INPUT_SIZE) then the actual input is replaced by one generated by
+    aoc_inputs with that size and input_seed (defaults to AOC_INPUT_SEED).
+    Unless history is False (defaults to not AOC_NO_HISTORY) timed runs of the actual input are
+    appended to HISTORY_DB, see record_run.
+    With AOC_HEADLESS=json the usual output goes to stderr and a single JSON object describing the
+    run is printed to stdout.
     """
-    assert(isinstance(day, str)) 
+    assert(isinstance(day, str))
+    options = {
+        'benchmark': BENCHMARK if benchmark_mode is None else benchmark_mode,
+        'profile': PROFILE if profile_mode is None else profile_mode,
+        'memory': MEMORY if memory_mode is None else memory_mode,
+        'timeout': TIMEOUT if timeout is None else timeout,
+        'memory_limit': MEMORY_LIMIT if memory_limit is None else memory_limit,
+        'input_size': INPUT_SIZE if input_size is None else input_size,
+        'input_seed': INPUT_SEED if input_seed is None else input_seed,
+        'history': HISTORY if history is None else history,
+        'parse_input': parse_input,
+        'input_mode': input_mode,
+    }
+    # Cached results would make benchmarking, profiling and measuring memory pointless
+    options['use_cache'] = use_cache and not (options['benchmark'] or options['profile'] or options['memory'])
 
-    console.rule(f'[bold red]{the_func.__name__}', align='left')
-    if sep_part_b_input:
-        suffix = '-b'
+    if HEADLESS == 'json':
+        record = {'day': day, 'part': the_func.__name__}
+        stdout = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            _test_and_execute(the_func, day, test_assertion, path, sep_part_b_input, options, record)
+        builtins.print(json.dumps(record, default=str), file=stdout)
     else:
-        suffix = ''
-    for input_index, input_path in enumerate((
-            path / f'day{day}-test{suffix}.txt',
-            path / f'day{day}-input{suffix}.txt')):
-        with input_path.open('r') as f:
-            lines = [line.strip() for line in f.readlines()]
-        start = time.time()
-        result = the_func(lines)
-        duration = time.time() - start
-        print(f'[yellow]Duration:[/] {duration}')
+        _test_and_execute(the_func, day, test_assertion, path, sep_part_b_input, options, {})
+
+
+def _test_and_execute(the_func, day, test_assertion, path, sep_part_b_input, options, record):
+    """ Does the work of test_and_execute, filling in record with the results as it goes.
+    options is a dict of the modes test_and_execute was asked for.
+    """
+    parse_input = options['parse_input']
+    input_mode = options['input_mode']
+    console.rule(f'[bold red]{the_func.__name__}', align='left')
+    paths = input_paths(path, day, sep_part_b_input)
+    # The name results are stored under, generated inputs get their own entries
+    part_name = the_func.__name__
+    if options['input_size'] is not None:
+        import aoc_inputs
+        paths = (paths[0], aoc_inputs.generated_input(day, options['input_size'], options['input_seed']))
+        print(f'[yellow]Generated input:[/] {paths[1].name}')
+        part_name = f'{part_name}@{options["input_size"]}'
+        record['input_size'] = options['input_size']
+        record['input_seed'] = options['input_seed']
+    for input_index, input_path in enumerate(paths):
+        prefix = 'test_' if input_index == 0 else ''
+        # The test run is always done for real, it's what catches a regression in the solver or a helper
+        use_cache = options['use_cache'] and input_index == 1
+        if input_index == 1 and options['benchmark']:
+            data, parse_ns = load_input(input_path, parse_input, input_mode)
+            if parse_ns is not None:
+                print(f'[yellow]Parse duration:[/] {format_ns(parse_ns)}')
+            result, stats = benchmark(the_func, data_getter(input_path, parse_input, input_mode))
+            print(f'[yellow]Benchmark:[/] {stats["runs"]} runs '
+                  f'min={format_ns(stats["min_ns"])} median={format_ns(stats["median_ns"])} '
+                  f'p95={format_ns(stats["p95_ns"])} stddev={format_ns(stats["stddev_ns"])}')
+            write_benchmark_results(day, part_name, stats)
+            record['benchmark'] = stats
+        elif input_index == 1 and options['profile']:
+            data, parse_ns = load_input(input_path, parse_input, input_mode)
+            if parse_ns is not None:
+                print(f'[yellow]Parse duration:[/] {format_ns(parse_ns)}')
+            result, duration = profile(the_func, data, PROFILE_DIR / f'day{day}-{part_name}')
+            print(f'[yellow]Duration (profiled):[/] {format_ns(duration)}')
+            record['duration_ns'] = duration
+        elif input_index == 1 and options['memory']:
+            data, parse_ns = load_input(input_path, parse_input, input_mode)
+            if parse_ns is not None:
+                print(f'[yellow]Parse duration:[/] {format_ns(parse_ns)}')
+            result, duration, memory = measure_memory(the_func, data)
+            print(f'[yellow]Duration (tracemalloc):[/] {format_ns(duration)}')
+            print_memory(memory)
+            record['duration_ns'] = duration
+            record['memory'] = memory
+        elif options['timeout'] or options['memory_limit']:
+            try:
+                result, duration, cached, parse_ns = run_isolated(
+                    solve, (the_func, input_path, use_cache, parse_input, input_mode),
+                    options['timeout'], options['memory_limit'])
+            except PartFailure as e:
+                console.print(f'[bold red]{"Test" if input_index == 0 else "Real-deal"} run {e}[/]')
+                record[f'{prefix}error'] = str(e)
+                record[f'{prefix}status'] = e.status
+                return
+            if parse_ns is not None:
+                print(f'[yellow]Parse duration:[/] {format_ns(parse_ns)}')
+            print(f'[yellow]Duration (isolated):[/] {format_ns(duration)}{" (cached)" if cached else ""}')
+            record[f'{prefix}duration_ns'] = duration
+            record[f'{prefix}cached'] = cached
+        else:
+            result, duration, cached, parse_ns = solve(the_func, input_path, use_cache, parse_input, input_mode)
+            if parse_ns is not None:
+                print(f'[yellow]Parse duration:[/] {format_ns(parse_ns)}')
+            print(f'[yellow]Duration:[/] {format_ns(duration)}{" (cached)" if cached else ""}')
+            record[f'{prefix}duration_ns'] = duration
+            record[f'{prefix}cached'] = cached
+        if parse_ns is not None:
+            record[f'{prefix}parse_ns'] = parse_ns
+        record[f'{prefix}result'] = result
+        if input_index == 1 and options['history']:
+            if 'benchmark' in record:
+                record_run(day, the_func.__name__, input_path, record['benchmark']['min_ns'], mode='benchmark')
+            elif 'memory' in record:
+                record_run(day, the_func.__name__, input_path, record['duration_ns'], record['memory']['peak_bytes'],
+                           mode='memory')
+            elif not (options['profile'] or record['cached']):
+                record_run(day, the_func.__name__, input_path, record['duration_ns'],
+                           mode='isolated' if options['timeout'] or options['memory_limit'] else 'run')
         if input_index == 0:
             assert(result == test_assertion)
             console.print(f'[bold red]Test result:[/] [magenta on yellow]{result}[/]')
@@ -38,3 +1612,224 @@ def test_and_execute(the_func, day=None, test_assertion=None, path=Path(__file__
             console.print(f'[bold red]Real-deal result:[/] [magenta on yellow]{result}[/]')
 
     # print(Panel('\n'.join(output), title=f'{the_func.__name__} Results'))
+
+
+# The day registry. Each dayNN.py only calls test_and_execute when run as a script, so importing
+# it just defines day, part_a, part_b and test_assertion_a/b. That lets us find and run every day
+# from a single process.
+
+ROOT = Path(__file__).parent
+PARTS = ('a', 'b')
+
+
+class Day:
+    """ A solution module for one day, imported but not run.
+    """
+
+    def __init__(self, path):
+        """ path is the dayNN.py file
+        """
+        self.path = path
+        self.dir = path.parent
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.day = self.module.day
+        self.parse_input = getattr(self.module, 'parse_input', None)
+        self.input_mode = getattr(self.module, 'input_mode', 'lines')
+        # (reference, optimized) pairs of solvers that should always agree, see differential
+        self.differential_pairs = getattr(self.module, 'differential_pairs', [])
+
+    def part(self, part):
+        """ Return (the_func, test_assertion, sep_part_b_input) for part 'a' or 'b', the same
+        arguments the module itself passes to test_and_execute.
+        """
+        the_func = getattr(self.module, f'part_{part}')
+        test_assertion = getattr(self.module, f'test_assertion_{part}')
+        sep_part_b_input = part == 'b' and getattr(self.module, 'sep_part_b_input', False)
+        return the_func, test_assertion, sep_part_b_input
+
+    def __repr__(self):
+        return f'Day({self.day}, {self.dir.name})'
+
+
+def day_paths(root=ROOT):
+    """ Return {day: path to dayNN.py} for every day directory under root
+    """
+    paths = {}
+    for day_dir in sorted(root.glob('day[0-9][0-9]-*')):
+        day = day_dir.name[3:5]
+        path = day_dir / f'day{day}.py'
+        if path.exists():
+            paths[day] = path
+    return paths
+
+
+def discover_days(root=ROOT):
+    """ Return {day: Day} for every day under root
+    """
+    return {day: Day(path) for day, path in day_paths(root).items()}
+
+
+# Days already imported by this process, so a worker only imports each day once.
+_loaded_days = {}
+
+
+def load_day(day, root=ROOT):
+    """ Return the Day for day (e.g. '05'), importing it if this process hasn't already.
+    """
+    if day not in _loaded_days:
+        _loaded_days[day] = Day(day_paths(root)[day])
+    return _loaded_days[day]
+
+
+def run_part(day, part, root=ROOT, use_cache=True, memory=False, history=HISTORY, isolated=False):
+    """ Run one part of one day against its test and actual inputs without printing anything.
+    Returns a dict describing the outcome. Errors are recorded in the dict rather than raised so
+    that one broken day doesn't take down a whole run.
+    If memory then the actual input is run with measure_memory instead, and the report includes its
+    memory dict.
+    If history then the timed run of the actual input is appended to HISTORY_DB (unless it was cached),
+    as an 'isolated' run if isolated says it's running in an isolated_pool.
+    """
+    report = {'day': day, 'part': part}
+    try:
+        the_func, test_assertion, sep_part_b_input = load_day(day, root).part(part)
+        test_path, actual_path = input_paths(load_day(day, root).dir, day, sep_part_b_input)
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_input = load_day(day, root).parse_input
+            input_mode = load_day(day, root).input_mode
+            # Never from the cache, so a broken solver or helper fails its test
+            report['test_result'], _, _, _ = solve(the_func, test_path, False, parse_input, input_mode)
+            if memory:
+                data, report['parse_ns'] = load_input(actual_path, parse_input, input_mode)
+                report['result'], report['duration_ns'], report['memory'] = measure_memory(the_func, data)
+                report['cached'] = False
+            else:
+                report['result'], report['duration_ns'], report['cached'], report['parse_ns'] = solve(
+                    the_func, actual_path, use_cache, parse_input, input_mode)
+        report['test_passed'] = report['test_result'] == test_assertion
+        if history and memory:
+            record_run(day, the_func.__name__, actual_path, report['duration_ns'], report['memory']['peak_bytes'],
+                       mode='memory')
+        elif history and not report['cached']:
+            record_run(day, the_func.__name__, actual_path, report['duration_ns'],
+                       mode='isolated' if isolated else 'run')
+    except PartFailure as e:
+        report['error'] = str(e)
+        report['status'] = e.status
+    except MemoryError as e:
+        report['error'] = f'MemoryError: {e}'
+        report['status'] = 'memory'
+    except Exception as e:
+        if is_out_of_memory(e):
+            report['error'] = f'ran out of memory ({type(e).__name__})'
+            report['status'] = 'memory'
+        else:
+            report['error'] = f'{type(e).__name__}: {e}'
+    return report
+
+
+def batch_inputs(specs):
+    """ Expand a list of directories (every .txt file in them) and glob patterns into a sorted list of
+    input paths with no repeats.
+    """
+    import glob
+    paths = set()
+    for spec in specs:
+        if Path(spec).is_dir():
+            paths.update(Path(spec).glob('*.txt'))
+        else:
+            paths.update(Path(p) for p in glob.glob(spec, recursive=True) if Path(p).is_file())
+    return sorted(paths)
+
+
+# Modules the days and the helpers they use only import once they need them, which warm_worker (and
+# isolated_worker) import up front. numpy alone is ~80ms, which would otherwise land on the first input
+# a worker is given.
+WARM_IMPORTS = ('numpy', 'concurrent.futures', 'sqlite3')
+
+
+def warm_imports():
+    """ Import WARM_IMPORTS, skipping any that aren't installed
+    """
+    for name in WARM_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def warm_worker(days=None, root=ROOT):
+    """ Pool initializer that imports days (default all of them) and WARM_IMPORTS up front, so the
+    start up cost is paid once per worker rather than by the first input it runs.
+    """
+    for day in days or day_paths(root):
+        load_day(day, root)
+    warm_imports()
+
+
+def run_input(day, part, input_path, root=ROOT, use_cache=True, history=HISTORY):
+    """ Run one part of one day on any input file without printing anything. Returns a dict like
+    run_part, with the result and duration or an error.
+    """
+    report = {'day': day, 'part': part, 'input': str(input_path)}
+    try:
+        the_day = load_day(day, root)
+        the_func, _, _ = the_day.part(part)
+        with contextlib.redirect_stdout(io.StringIO()):
+            report['result'], report['duration_ns'], report['cached'], report['parse_ns'] = solve(
+                the_func, Path(input_path), use_cache, the_day.parse_input, the_day.input_mode)
+        if history and not report['cached']:
+            record_run(day, the_func.__name__, Path(input_path), report['duration_ns'])
+    except Exception as e:
+        report['error'] = f'{type(e).__name__}: {e}'
+    return report
+
+
+def run_batch(day, input_paths, parts=PARTS, workers=None, root=ROOT, use_cache=True):
+    """ Run the given parts of day on every one of input_paths, fanned out over a pool of worker
+    processes that each import the day once (one per core unless workers says otherwise). Returns a
+    list of run_input reports ordered by input and part, plus the wall clock time in nanoseconds.
+    """
+    import concurrent.futures
+
+    jobs = [(input_path, part) for input_path in input_paths for part in parts]
+    start = time.perf_counter_ns()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=warm_worker,
+                                                initargs=([day], root)) as pool:
+        futures = [pool.submit(run_input, day, part, input_path, root, use_cache) for input_path, part in jobs]
+        reports = [future.result() for future in futures]
+    return reports, time.perf_counter_ns() - start
+
+
+def run_all_days(days=None, workers=None, root=ROOT, use_cache=True, memory=False, timeout=TIMEOUT,
+                 memory_limit=MEMORY_LIMIT):
+    """ Run every part of the given days (default all of them) in a pool of worker processes,
+    one process per core unless workers says otherwise. Returns a list of run_part reports
+    ordered by day and part, plus the wall clock time of the whole run in nanoseconds.
+    With a timeout (seconds per part) or memory_limit (bytes per worker) the pool is a Pebble one
+    that kills parts that overrun, their reports get an error and a status of 'timeout', 'memory'
+    or 'died' instead of a result.
+    """
+    import concurrent.futures
+
+    if days is None:
+        days = list(day_paths(root))
+    jobs = [(day, part) for day in days for part in PARTS]
+    start = time.perf_counter_ns()
+    if timeout or memory_limit:
+        reports = []
+        with isolated_pool(workers or os.cpu_count(), memory_limit) as pool:
+            futures = [pool.schedule(run_part, (day, part, root, use_cache, memory, HISTORY, True), timeout=timeout)
+                       for day, part in jobs]
+            for (day, part), future in zip(jobs, futures):
+                try:
+                    reports.append(wait_isolated(future, timeout, memory_limit))
+                except PartFailure as e:
+                    reports.append({'day': day, 'part': part, 'error': str(e), 'status': e.status})
+        return reports, time.perf_counter_ns() - start
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(run_part, day, part, root, use_cache, memory) for day, part in jobs]
+        reports = [future.result() for future in futures]
+    return reports, time.perf_counter_ns() - start
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"strconv"
+	"time"
 )
 
 // Yeah - my first go program! I'm sure it shows. :-)
@@ -55,6 +56,9 @@ func readDepths(fname string) []int {
 
 	var depths []int
 	for _, line := range text {
+		if line == "" {
+			continue
+		}
 		i, _ := strconv.Atoi(line)
 		depths = append(depths, i)
 	}
@@ -62,6 +66,18 @@ func readDepths(fname string) []int {
 }
 
 func main() {
+	// With an input file as the argument, print "<part> <answer> <nanoseconds>" for each part,
+	// timing the read and the solve but not the process start up. ./aoc.py cross-benchmark uses this.
+	if len(os.Args) > 1 {
+		start := time.Now()
+		count := numIncreasing(readDepths(os.Args[1]))
+		fmt.Printf("a %d %d\n", count, time.Since(start).Nanoseconds())
+		start = time.Now()
+		count = numIncreasingWindow(readDepths(os.Args[1]))
+		fmt.Printf("b %d %d\n", count, time.Since(start).Nanoseconds())
+		return
+	}
+
 	// Part A
 	var count int
 	test_depths := readDepths("day01-test.txt")
@@ -4,27 +4,87 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+import collections
+import time
 
 day = '01'
 test_assertion_a = 7
 test_assertion_b = 5
+# Hand the parts the raw bytes of the input (memory mapped), which they scan into numpy arrays a chunk at
+# a time, so sonar logs bigger than memory work too
+input_mode = 'buffer'
 
-def part_a(lines):
-    depths = [int(line) for line in lines if line != '']
-    count = 0
-    for i in range(len(depths)-1):
-        if depths[i] < depths[i+1]:
-            count += 1
-    return count
 
-def part_b(lines):
-    depths = [int(line) for line in lines if line != '']
+def count_increases(buffer, window):
+    """ Return how many sums of window consecutive depths are bigger than the sum of the window before.
+    Adjacent windows share all but their first and last depths, so window i + 1 is bigger than window i
+    exactly when d[i + window] > d[i], and we can compare every pair at once without summing anything.
+    Only the last window depths of each chunk are carried over to the next.
+    """
+    import numpy as np
+
     count = 0
-    for i in range(len(depths)-3):
-        if sum(depths[i:i+3]) < sum(depths[i+1:i+4]):
-            count += 1
+    tail = np.zeros(0, dtype=np.int64)
+    for chunk in aoc_utils.scan_int_chunks(buffer, scan=aoc_utils.whitespace_ints):
+        depths = np.concatenate([tail, chunk])
+        count += int(np.count_nonzero(depths[window:] > depths[:-window]))
+        tail = depths[-window:]
     return count
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
 
+def part_a(buffer):
+    return count_increases(buffer, 1)
+
+
+def part_b(buffer, window=3):
+    return count_increases(buffer, window)
+
+
+class SonarMonitor:
+    """ Counts window increases the same way as count_increases, but for depths that arrive one at a time,
+    e.g. from a live feed that never ends. Only the last max(windows) depths are kept, in a ring buffer,
+    so memory and the work per depth stay the same however many have gone by.
+    """
+
+    def __init__(self, windows=(1, 3)):
+        self.windows = sorted(set(windows))
+        self.ring = collections.deque(maxlen=self.windows[-1])
+        self.counts = {window: 0 for window in self.windows}
+        self.samples = 0
+
+    def add(self, depth):
+        """ Take the next depth and update the count for each window size
+        """
+        ring = self.ring
+        for window in self.windows:
+            # Window sum goes up exactly when this depth is bigger than the one window depths back
+            if len(ring) < window:
+                break
+            if depth > ring[-window]:
+                self.counts[window] += 1
+        ring.append(depth)
+        self.samples += 1
+
+    def watch(self, lines, every=1000, seconds=None):
+        """ Add the depth on each of lines (blank ones are skipped) and yield (samples, counts) after every
+        every depths, or once seconds have passed since the last report, and at the end if there's anything new.
+        """
+        next_report = time.monotonic() + seconds if seconds else None
+        reported = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            self.add(int(line))
+            if (every and self.samples % every == 0) or (next_report and time.monotonic() >= next_report):
+                reported = self.samples
+                yield self.samples, dict(self.counts)
+                if next_report:
+                    next_report = time.monotonic() + seconds
+        if reported != self.samples:
+            yield self.samples, dict(self.counts)
+
+
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, input_mode=input_mode)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, input_mode=input_mode)
@@ -1,9 +1,12 @@
-
 package main
 
 import (
-	string
-	strconv
+	"bufio"
+	"fmt"
+	"os"
+	"strconv"
+	"strings"
+	"time"
 )
 
 // def part_a(lines):
@@ -28,9 +31,10 @@ import (
 func partA(lines []string) int {
 	forward := 0
 	depth := 0
-	for _, line:= range lines {
-		command, amountStr := string.Fields(line)
-		amount := strconv.Atoi(amountStr)
+	for _, line := range lines {
+		fields := strings.Fields(line)
+		command, amountStr := fields[0], fields[1]
+		amount, _ := strconv.Atoi(amountStr)
 		switch command {
 		case "forward":
 			forward += amount
@@ -41,4 +45,65 @@ func partA(lines []string) int {
 		}
 	}
 	return forward * depth
-}
\ No newline at end of file
+}
+
+// Same as partA except up and down change the aim, and forward also moves by aim * amount
+func partB(lines []string) int {
+	forward := 0
+	depth := 0
+	aim := 0
+	for _, line := range lines {
+		fields := strings.Fields(line)
+		command, amountStr := fields[0], fields[1]
+		amount, _ := strconv.Atoi(amountStr)
+		switch command {
+		case "forward":
+			forward += amount
+			depth += aim * amount
+		case "down":
+			aim += amount
+		case "up":
+			aim -= amount
+		}
+	}
+	return forward * depth
+}
+
+// Read the file and return its non-blank lines
+func readLines(fname string) []string {
+	file, err := os.Open(fname)
+	if err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		os.Exit(1)
+	}
+	defer file.Close()
+	scanner := bufio.NewScanner(file)
+	var lines []string
+	for scanner.Scan() {
+		if line := scanner.Text(); line != "" {
+			lines = append(lines, line)
+		}
+	}
+	return lines
+}
+
+func main() {
+	// With an input file as the argument, print "<part> <answer> <nanoseconds>" for each part,
+	// timing the read and the solve but not the process start up. ./aoc.py cross-benchmark uses this.
+	if len(os.Args) > 1 {
+		start := time.Now()
+		answer := partA(readLines(os.Args[1]))
+		fmt.Printf("a %d %d\n", answer, time.Since(start).Nanoseconds())
+		start = time.Now()
+		answer = partB(readLines(os.Args[1]))
+		fmt.Printf("b %d %d\n", answer, time.Since(start).Nanoseconds())
+		return
+	}
+
+	testLines := readLines("day02-test.txt")
+	realLines := readLines("day02-input.txt")
+	fmt.Printf("Part a sample: %d\n", partA(testLines))
+	fmt.Printf("Part a actual: %d\n", partA(realLines))
+	fmt.Printf("Part b sample: %d\n", partB(testLines))
+	fmt.Printf("Part b actual: %d\n", partB(realLines))
+}
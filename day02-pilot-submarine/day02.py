@@ -1,54 +1,92 @@
 #! /usr/bin/env python3
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
+import functools
 
 day = '02'
 test_assertion_a = 150
 test_assertion_b = 900
+# Hand the parts the raw bytes of the input (memory mapped), which follow_commands splits into chunks
+input_mode = 'buffer'
 
-def part_a(lines):
-    forward = 0
-    depth = 0
-    for line in lines:
-        command, amount = line.split(' ')
-        amount = int(amount)
-        match command:
-            case 'forward':
-                forward += amount
-            case 'down':
-                depth += amount
-            case 'up':
-                depth -= amount
-            case _:
-                raise Exception(f'Unrecognized command {command}')
+
+# Following the commands is a fold over (forward, depth, aim). A run of commands, started with aim 0, moves
+# forward F, changes aim by A and goes down D. Started with aim a instead, every forward in it goes down a
+# more per unit, so it goes down D + a * F. That makes each run of commands a transform of the state that
+# we can work out without knowing the state, and two of them compose (see combine), so a log can be split
+# into chunks, the chunks folded separately (in parallel), and the results combined in order.
+# Commands are encoded by their first letter
+FORWARD, DOWN, UP = ord('f'), ord('d'), ord('u')
+
+
+def encode_commands(chunk):
+    """ Return (opcodes, amounts), numpy arrays of the first letter (as a byte) and the amount of every
+    command in chunk, a numpy array of the bytes of whole lines. Blank lines are skipped.
+    """
+    import numpy as np
+
+    line_starts = np.concatenate([[0], np.flatnonzero(chunk == ord('\n')) + 1])
+    line_starts = line_starts[line_starts < len(chunk)]
+    opcodes = chunk[line_starts]
+    opcodes = opcodes[opcodes != ord('\n')]
+    # The command words have no digits, so the integers are the amounts, one per line
+    amounts = aoc_utils.scan_ints(chunk)
+    unknown = opcodes[~np.isin(opcodes, [FORWARD, DOWN, UP])]
+    if len(unknown):
+        raise Exception(f'Unrecognized command starting {chr(unknown[0])!r}')
+    if len(opcodes) != len(amounts):
+        raise Exception(f'{len(opcodes)} commands but {len(amounts)} amounts')
+    return opcodes, amounts
+
+
+def fold_commands(chunk):
+    """ Return the (forward, depth, aim) transform for the commands in chunk, a numpy array of the bytes of
+    whole lines, starting from aim 0. Part a's depth is just the aim.
+    All at once rather than a command at a time: the aim at each forward is the running sum of the downs
+    less the ups before it.
+    """
+    import numpy as np
+
+    opcodes, amounts = encode_commands(chunk)
+    is_forward = opcodes == FORWARD
+    aim = np.cumsum(np.where(opcodes == DOWN, amounts, 0) - np.where(opcodes == UP, amounts, 0))
+    forward_amounts = amounts[is_forward]
+    forward = int(forward_amounts.sum())
+    depth = int((aim[is_forward] * forward_amounts).sum())
+    return forward, depth, int(aim[-1]) if len(aim) else 0
+
+
+def combine(first, second):
+    """ Return the transform for the commands of first followed by those of second
+    """
+    forward, depth, aim = first
+    return forward + second[0], depth + second[1] + aim * second[0], aim + second[2]
+
+
+def follow_commands(buffer):
+    """ Return (forward, depth, aim) after all the commands in buffer, folding chunks of it on a pool of
+    processes if it's big enough to be worth it.
+    """
+    return functools.reduce(combine, aoc_utils.map_chunks(buffer, fold_commands), (0, 0, 0))
+
+
+def part_a(buffer):
+    # Without aim, what part b calls aim is the depth
+    forward, _, depth = follow_commands(buffer)
     print(f'{forward=}')
     print(f'{depth=}')
     return forward * depth
 
-def part_b(lines):
-    forward = 0
-    depth = 0
-    aim = 0
-    for line in lines:
-        command, amount = line.split(' ')
-        amount = int(amount)
-        match command:
-            case 'forward':
-                forward += amount
-                depth += aim * amount
-            case 'down':
-                aim += amount
-            case 'up':
-                aim -= amount
-            case _:
-                raise Exception(f'Unrecognized command {command}')
+def part_b(buffer):
+    forward, depth, _ = follow_commands(buffer)
     print(f'{forward=}')
     print(f'{depth=}')
     return forward * depth
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, input_mode=input_mode)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, input_mode=input_mode)
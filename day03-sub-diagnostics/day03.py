@@ -1,41 +1,88 @@
 #! /usr/bin/env python3
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 import operator
 
 day = '03'
 test_assertion_a = 198
 test_assertion_b = 230
 
-def part_a(lines):
-    num_bits = len(lines[0])
-    num_lines = len(lines)
-    bits = [[line[i] for line in lines] for i in range(num_bits)]
-    gamma = ['1' if bits[i].count('1') > (num_lines/2) else '0' for i in range(num_bits)]
-    epsilon = ['0' if bit == '1' else '1' for bit in gamma]
-    g = int(''.join(gamma), 2)
-    e = int(''.join(epsilon), 2)
-    return g * e
-
-def part_b(lines):
-    num_bits = len(lines[0])
+# parse_input packs the raw bytes of the report into numbers
+input_mode = 'buffer'
+
+
+def parse_input(raw_input):
+    """ Return (readings, width) where readings is a numpy uint64 array of the report's binary numbers
+    (up to 64 bits wide) and width is how many bits they have. Shared by part_a and part_b.
+    The 0 and 1 bytes are picked out of the whole report at once and packed a column at a time, so
+    there's never a Python object per reading or per bit.
+    """
+    import numpy as np
+
+    raw = np.frombuffer(raw_input, dtype=np.uint8)
+    width = int(np.argmax(raw == ord('\n'))) if (raw == ord('\n')).any() else len(raw)
+    bits = raw[(raw == ord('0')) | (raw == ord('1'))] - ord('0')
+    bits = bits.reshape(-1, width)
+    readings = np.zeros(len(bits), dtype=np.uint64)
+    for column in range(width):
+        readings = (readings << np.uint64(1)) | bits[:, column]
+    return readings, width
+
+
+def count_ones(readings, bit):
+    """ Return how many of readings have bit (0 is the least significant) set
+    """
+    import numpy as np
+
+    return int(np.count_nonzero((readings >> np.uint64(bit)) & np.uint64(1)))
+
+
+def part_a(report):
+    readings, width = report
+    gamma = 0
+    for bit in range(width):
+        if count_ones(readings, bit) > len(readings) / 2:
+            gamma |= 1 << bit
+    epsilon = ~gamma & ((1 << width) - 1)
+    return gamma * epsilon
+
+def part_b(report):
+    """ Sorted, the readings that share their top bits are a contiguous run, and within the run the ones
+    with the next bit set all come after the ones without it. So narrowing down to a rating never has to
+    look at the readings themselves, just binary search for where each bit flips inside the current run.
+    """
+    import numpy as np
+
+    readings, width = report
+    readings = np.sort(readings)
+    # Duplicates count once, like a set of the lines would
+    readings = readings[np.concatenate([[True], readings[1:] != readings[:-1]])]
     product = 1
     for op in (operator.ge, operator.lt):
-        element = set(lines)
-        for i in range(num_bits):
-            chosen = '1' if op([e[i] for e in element].count('1'), len(element) / 2) else '0'
-            element = set([e for e in element if e[i] == chosen])
-            if len(element) == 1:
+        # The candidates are readings[low:high], all starting with the bits of prefix
+        low, high = 0, len(readings)
+        prefix = 0
+        for bit in reversed(range(width)):
+            split = low + int(readings[low:high].searchsorted(np.uint64(prefix | 1 << bit)))
+            if op(high - split, (high - low) / 2):
+                low = split
+                prefix |= 1 << bit
+            else:
+                high = split
+            if high - low == 1:
                 break
         else:
             raise Exception('We got through the set of elements without finding a unique match')
-        product *= int(element.pop(), 2)
+        product *= int(readings[low])
     return product
-  
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, parse_input=parse_input,
+                               input_mode=input_mode)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, parse_input=parse_input,
+                               input_mode=input_mode)
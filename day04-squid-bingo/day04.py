@@ -11,15 +11,19 @@ test_assertion_b = 1924
 
 BOARD_SIDE = 5
 
-def build_boards_and_results(lines):
+def parse_input(lines):
+    """ Return (picks, boards). Shared by part_a and part_b, so neither modifies it.
+    Picks is a list of integer numbers to play on the boards
+    Each board is a list of BOARD_SIDE*BOARD_SIDE integers, boards is a list of such boards
+    """
+    picks = [int(s) for s in lines[0].split(',')]
     line_i = 2
     boards = []
     while line_i < len(lines):
         this_board = [int(p) for p in ' '.join(lines[line_i:line_i+BOARD_SIDE]).split()]
         boards.append(this_board)
         line_i += BOARD_SIDE + 1
-    results = [[False] * len(b) for b in boards]
-    return (boards, results)
+    return (picks, boards)
 
 
 def apply_pick(pick, board, board_results):
@@ -55,14 +59,11 @@ def score_board(pick, board, board_results):
     return pick * sum
 
     
-def part_a(lines, find_last_winner=False):
-    # Picks is a list of integer numbers to play on the boards
-    picks = [int(s) for s in lines[0].split(',')]
-    # Each board is a list of BOARD_SIDE*BOARD_SIDE integers
-    # boards is a list of such boards
+def part_a(picks_and_boards, find_last_winner=False):
+    picks, boards = picks_and_boards
     # results has the same shape as boards, but stores booleans in each location indicating
     # if that board space has been picked
-    boards, results = build_boards_and_results(lines)
+    results = [[False] * len(b) for b in boards]
     winners = set()
     for pick in picks:
         for board_i, board in enumerate(boards):
@@ -82,9 +83,10 @@ def part_a(lines, find_last_winner=False):
     raise Exception('No winner found')
 
 
-def part_b(lines):
-    return part_a(lines, find_last_winner=True)
+def part_b(picks_and_boards):
+    return part_a(picks_and_boards, find_last_winner=True)
 
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, parse_input=parse_input)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, parse_input=parse_input)
@@ -1,32 +1,29 @@
 #! /usr/bin/env python3
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
-import parse
+from aoc_utils import print
 import itertools
 
 day = '05'
 test_assertion_a = 5
 test_assertion_b = 12
+# parse_input scans the raw bytes for numbers
+input_mode = 'buffer'
 
-def read_input(raw_input):
+def parse_input(raw_input):
     """ Return max value of x, max value of y, and a list of [x1, y1, x2, y2] lists representing
-    the lines in the input.
-    Note that elements of raw_input are the raw format from the input files of this format:
+    the lines in the input. Shared by part_a and part_b.
+    Note that raw_input is the raw bytes of the input file, with lines of this format:
     x1,y1 -> x2,y2
     """
-    lines = []
-    max_x = 0
-    max_y = 0
-    for l in raw_input:
-        r = parse.parse('{x1:d},{y1:d} -> {x2:d},{y2:d}', l)
-        lines.append((r['x1'], r['y1'], r['x2'], r['y2']))
-        max_x = max(max_x, r['x1'], r['x2'])
-        max_y = max(max_y, r['y1'], r['y2'])
-    return (max_x, max_y, lines)
+    # Every line is exactly four numbers, so scan them all out in one go
+    vents = aoc_utils.scan_ints(raw_input, 4)
+    max_x = int(vents[:, [0, 2]].max())
+    max_y = int(vents[:, [1, 3]].max())
+    return (max_x, max_y, vents.tolist())
 
 def populate_field(lines, field, ignore_diags=True):
     """ Take each of the lines and increment by one each point in field that each line
@@ -68,8 +65,8 @@ def count_overlaps(field):
     return num_overlaps
 
 
-def part_a(raw_input, ignore_diags=True):
-    max_x, max_y, lines = read_input(raw_input)
+def part_a(vents, ignore_diags=True):
+    max_x, max_y, lines = vents
     # Note that our field dimentions need to be one greater than max_x and max_y to
     # account for 0-indexing of the ranges.
     field = [[0 for i in range(max_x + 1)] for j in range(max_y + 1)]
@@ -79,9 +76,12 @@ def part_a(raw_input, ignore_diags=True):
     return count_overlaps(field)
 
 
-def part_b(lines):
+def part_b(vents):
     # Same as part_a, except include diagonal lines.
-    return part_a(lines, ignore_diags=False)
+    return part_a(vents, ignore_diags=False)
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, parse_input=parse_input,
+                               input_mode=input_mode)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, parse_input=parse_input,
+                               input_mode=input_mode)
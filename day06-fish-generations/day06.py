@@ -1,10 +1,10 @@
 #! /usr/bin/env python3
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 
 import collections # https://docs.python.org/3/library/collections.html
 
@@ -48,5 +48,6 @@ def part_b(lines):
     return part_a(lines, num_days=256)
 
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
@@ -1,10 +1,10 @@
 #! /usr/bin/env python3
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 import collections
 
 day = '07'
@@ -74,5 +74,6 @@ def part_b(lines):
     return min(cost)
 
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
@@ -184,5 +184,6 @@ def part_b(lines):
     return sum
     
 
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
@@ -1,14 +1,16 @@
 #! /usr/bin/env python3
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 
 day = '10'
 test_assertion_a = 26397
 test_assertion_b = 288957
+# Read the input lazily, one line at a time, so huge inputs run in constant memory
+input_mode = 'stream'
 
 # pairs represents the correct closing character for each opening character.
 pairs = {
@@ -96,5 +98,6 @@ def part_b(lines):
 
 # test_and_execute is a utility function that runs the function with the correct input, checks that the 
 # output for the test data is the expected value, prints time it took to run, etc.
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, input_mode=input_mode)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, input_mode=input_mode)
@@ -3,10 +3,10 @@
 # See day14-questions.txt for context to this solution
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 
 import collections # https://docs.python.org/3/library/collections.html
 import itertools # https://docs.python.org/3/library/itertools.html
@@ -39,8 +39,8 @@ def do_insertion(polymer, replacements):
     return new_polymer
 
 
-def part_a(lines):
-    """ Perform the given grown strategy for 10 iterations. Return the difference
+def part_a(lines, steps=10):
+    """ Perform the given grown strategy for 10 iterations (or steps). Return the difference
     between the final counts of the most frequent and least frequent elements
     in the final polymer.
 
@@ -49,7 +49,7 @@ def part_a(lines):
     approach to this problem.
     """
     polymer, replacements = read_polymer_and_replacements(lines)
-    for i in range(10):
+    for i in range(steps):
         polymer = do_insertion(polymer, replacements)
     counts_sorted = collections.Counter(polymer).most_common()
     # The above most_common() call returns a liste of (polymer, count) sorted by count descending
@@ -57,8 +57,8 @@ def part_a(lines):
     return counts_sorted[0][1] - counts_sorted[-1][1]
 
 
-def part_b(lines):
-    """ Starting with the given polymer apply the growth mapping 40 times and return
+def part_b(lines, steps=40):
+    """ Starting with the given polymer apply the growth mapping 40 times (or steps) and return
     the different between the counts of the most common and least common elements in
     the final polymer.
 
@@ -89,7 +89,7 @@ def part_b(lines):
     # pairs is a dictionary where the keys are strings of len 2 representing an adjancent pair
     # of elements. The values are the number of times that pair occurs in the polymer.
     pairs = collections.Counter([l + r for (l, r) in itertools.pairwise(polymer)])
-    for i in range(40):
+    for i in range(steps):
         new_pairs = collections.defaultdict(lambda: 0) # Dictionary with a default of 0 for unknown keys
         for (left, right), count in pairs.items():
             new_pairs[left + replacements[left + right]] += count
@@ -108,7 +108,19 @@ def part_b(lines):
     return max(counts.values()) - min(counts.values())
 
 
+def part_a_by_pairs(lines):
+    """ Part a done the part b way, counting pairs for 10 steps instead of building the polymer.
+    """
+    return part_b(lines, steps=10)
+
+
+# part_a builds the literal polymer, which makes it a handy reference to check the pair counting
+# against. See ./aoc.py differential 14
+differential_pairs = [(part_a, part_a_by_pairs)]
+
+
 # test_and_execute is a utility function that runs the function with the correct input, checks that the 
 # output for the test data is the expected value, prints time it took to run, etc.
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
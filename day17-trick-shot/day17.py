@@ -2,19 +2,19 @@
 
 # See day17-questions.txt for context to this solution
 
-from functools import cache
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
-import parse
+from aoc_utils import print
 
 
 day = '17'
 test_assertion_a = 45
 test_assertion_b = 112
 
+TARGET_FORMAT = aoc_utils.LineFormat('target area: x={:n}..{:n}, y={:n}..{:n}')
+
 
 def does_hit_target(initial_x_speed, initial_y_speed, target_x_left, target_x_right, target_y_top, target_y_bottom):
     y = x = 0
@@ -35,7 +35,7 @@ def does_hit_target(initial_x_speed, initial_y_speed, target_x_left, target_x_ri
     return (False, None)
 
 
-@cache
+@aoc_utils.disk_cache
 def find_ways_to_hit_target(target_x_left, target_x_right, target_y_top, target_y_bottom):
     count = 0
     max_y = 0
@@ -53,23 +53,27 @@ def find_ways_to_hit_target(target_x_left, target_x_right, target_y_top, target_
 
 
 # We really only need one of these functions below. But due to the way I've setup test_and_execute it's easier
-# to just have a separate part_a and part_b. This is the reason for the @cache on find_ways_to_hit_target, it
-# gets called for each part with the exact same arguments, so doesn't need to calculate more than once.
+# to just have a separate part_a and part_b. This is the reason for the @aoc_utils.disk_cache on find_ways_to_hit_target,
+# it gets called for each part with the exact same arguments, so doesn't need to calculate more than once.
+
+def parse_input(lines):
+    """ Return (target_x_left, target_x_right, target_y_top, target_y_bottom)
+    """
+    target_x_left, target_x_right, target_y_bottom, target_y_top = TARGET_FORMAT.parse(lines[0])
+    return (target_x_left, target_x_right, target_y_top, target_y_bottom)
+
 
-def part_a(lines):
-    r = parse.parse('target area: x={:n}..{:n}, y={:n}..{:n}', lines[0])
-    target_x_left, target_x_right, target_y_bottom, target_y_top = r.fixed
-    count, max_y = find_ways_to_hit_target(target_x_left, target_x_right, target_y_top, target_y_bottom)
+def part_a(target):
+    count, max_y = find_ways_to_hit_target(*target)
     return max_y
 
 
-def part_b(lines):
-    r = parse.parse('target area: x={:n}..{:n}, y={:n}..{:n}', lines[0])
-    target_x_left, target_x_right, target_y_bottom, target_y_top = r.fixed
-    count, max_y = find_ways_to_hit_target(target_x_left, target_x_right, target_y_top, target_y_bottom)
+def part_b(target):
+    count, max_y = find_ways_to_hit_target(*target)
     return count
 
 # test_and_execute is a utility function that runs the function with the correct input, checks that the 
 # output for the test data is the expected value, prints time it took to run, etc.
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, parse_input=parse_input)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, parse_input=parse_input)
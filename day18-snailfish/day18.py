@@ -3,16 +3,16 @@
 # See day18-questions.txt for context to this solution
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 import functools
 import itertools
 
 day = '18'
-test_assertion_a = None
-test_assertion_b = None
+test_assertion_a = 4140
+test_assertion_b = 3993
 
 class Node:
     """ Represents a node in a binary tree. Each of these nodes represents a snailfish number.
@@ -288,20 +288,32 @@ class Node:
 # # print(f'{sum.magnitude()=}')
 # assert(sum.magnitude() == 4140)
 
-print('PART A')
-path = Path(__file__).parent / 'day18-input.txt'
-with path.open('r') as f:
-    lines = f.readlines()
-nodes = [Node(line.strip()) for line in lines if line.strip()]
-sum = functools.reduce(lambda a,b:a+b, nodes)
-print(f'{sum.magnitude()=}')
+def parse_input(lines):
+    """ Return a Node for each snailfish number in the input. Shared by part_a and part_b, which is
+    safe because adding Nodes builds a new tree rather than modifying either side.
+    """
+    return [Node(line) for line in lines if line]
+
+
+def part_a(nodes):
+    """ Return the magnitude of the sum of all the snailfish numbers in the input
+    """
+    total = functools.reduce(lambda a,b:a+b, nodes)
+    return total.magnitude()
+
+
+def part_b(nodes):
+    """ Return the largest magnitude from adding any two different snailfish numbers in the input
+    """
+    max_magnitude = 0
+    for a, b in itertools.permutations(nodes, 2):
+        mag = (a + b).magnitude()
+        max_magnitude = max(max_magnitude, mag)
+    return max_magnitude
 
-print('PART B')
-max_magnitude = 0
-for a, b in itertools.permutations(nodes, 2):
-    sum = a + b
-    mag = sum.magnitude()
-    max_magnitude = max(max_magnitude, mag)
-print(f'Max magnitude is {max_magnitude}')
 
-print('DONE')
+# test_and_execute is a utility function that runs the function with the correct input, checks that the 
+# output for the test data is the expected value, prints time it took to run, etc.
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, parse_input=parse_input)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, parse_input=parse_input)
@@ -3,63 +3,50 @@
 # See day20-questions.txt for context to this solution
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 
 day = '20'
 test_assertion_a = 35
 test_assertion_b = 3351
 
+# Reads the 3x3 window around a pixel as a 9 bit number, top left is the most significant bit
+WINDOW_BITS = [[256, 128, 64], [32, 16, 8], [4, 2, 1]]
+
+
 class Image:
 
-    def __init__(self, algo, image_lines, padding):
-        """ Initialize image with data in image_lines and pad each edge with padding
-        extra rows/columns.
+    def __init__(self, algo, image_lines):
+        """ Initialize image with data in image_lines, an aoc_utils.Grid of 1 for lit pixels and 0 for dark.
         """
-        self.algo = algo
-        # actual_dim tracks the size of the actual data within the grid that we care about.
-        self.actual_dim = len(image_lines)
-        # image is the data from image_lines surrounded by padding
-        dim = len(image_lines) + 2 * padding
-        self.image = [['.'] * dim for i in range(padding)]
-        for row in image_lines:
-            self.image.append(['.'] * padding + [c for c in row] + ['.'] * padding)
-        self.image.extend([['.'] * dim for i in range(padding)])
-    
+        import numpy as np
+
+        self.algo = np.array([c == '#' for c in algo], dtype=np.int64)
+        self.image = aoc_utils.Grid.from_lines(image_lines, {'#': 1, '.': 0})
+        # The state of the infinite pixels outside the grid. They're all the same, but if algo lights
+        # a window of all dark pixels they flip every step.
+        self.background = 0
+
     def __repr__(self):
-        return '\n'.join([''.join(row) for row in self.image])
-    
+        return '\n'.join([''.join('#' if c else '.' for c in row) for row in self.image.rows().tolist()])
+
     def enhance(self):
-        """ Apply the image enhancement algorithm to the image.
+        """ Apply the image enhancement algorithm to the image. It grows by a pixel on every side, since
+        the pixels just outside it are the only ones outside that can see it.
         """
-        old_dim = len(self.image)
-        new_dim = old_dim
-        new_image = [['.'] * new_dim for i in range(new_dim)]
-        for y in range(1, old_dim - 1):
-            for x in range(1, old_dim - 1):
-                neighbors = self.image[y - 1][x - 1:x + 2]
-                neighbors += self.image[y][x - 1:x + 2]
-                neighbors += self.image[y + 1][x - 1:x + 2]
-                bits = ''.join(['1' if n == '#' else '0' for n in neighbors])
-                algo_i = int(bits, 2)
-                new_image[y][x] = self.algo[algo_i]
-        self.actual_dim += 2
-        self.image = new_image
-    
+        windows = self.image.pad(1, self.background).convolve(WINDOW_BITS, self.background)
+        windows.cells = self.algo[windows.cells]
+        self.image = windows
+        self.background = int(self.algo[511 if self.background else 0])
+
     def count_lit_bits(self):
-        r0 = 0
-        origin = (len(self.image) - self.actual_dim) // 2
-        for row_i in range(origin, origin + self.actual_dim):
-            for col_i in range(origin, origin + self.actual_dim):
-                if self.image[row_i][col_i] == '#':
-                    r0 += 1
-        return r0
-    
+        return int(self.image.cells.sum())
+
 
 def part_a(lines, n=2):
-    image = Image(lines[0], lines[2:], n * 2)
+    image = Image(lines[0], lines[2:])
     for i in range(n):
         image.enhance()
     return image.count_lit_bits()
@@ -71,5 +58,6 @@ def part_b(lines):
 
 # test_and_execute is a utility function that runs the function with the correct input, checks that the 
 # output for the test data is the expected value, prints time it took to run, etc.
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
@@ -5,18 +5,20 @@
 # from dataclasses import dataclass
 import collections
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
-import parse
+from aoc_utils import print
 import functools
 
 
 day = '22'
 test_assertion_a = 590784
 test_assertion_b = 2758514936282235
-
+# Part b has its own inputs, day22-test-b.txt and day22-input-b.txt
+sep_part_b_input = True
+# parse_input scans the raw bytes rather than going line by line
+input_mode = 'buffer'
 
 class Cuboid:
 
@@ -29,14 +31,6 @@ class Cuboid:
         self.z_min = z_min
         self.z_max = z_max
 
-    def is_within_50(self):
-        """ Return true if cuboid is within 50 of the origin, False otherwise.
-        The question states that all of the cuboid will be within that distance
-        or none of it will, so we can get away by just testing one bound on
-        each axis.
-        """
-        return -50 <= self.x_min <= 50 and -50 <= self.y_min <= 50 and -50 <= self.z_min <= 50
-    
     def get_intersection(self, earlier):
         """ Return a cuboid that compensates for the imposing of self over earlier.
         """
@@ -68,14 +62,35 @@ class Cuboid:
         return f'({self.state},{self.x_min},{self.x_max},{self.y_min},{self.y_max},{self.z_min},{self.z_max})'
 
 
-def part_a(lines, just_50=True):
-    # Create cuboids for each line of input, throwing some out if just_50
-    cuboids = []
-    for line in lines:
-        r = parse.parse('{:l} x={:d}..{:d},y={:d}..{:d},z={:d}..{:d}', line)
-        cuboid = Cuboid(True if r.fixed[0] == 'on' else False, *r.fixed[1:])
-        if (not just_50) or cuboid.is_within_50():
-            cuboids.append(cuboid)
+def parse_input(raw_input):
+    """ Return (states, bounds) for the lines of input, numpy arrays of whether each line turns cubes on and
+    of its x_min, x_max, y_min, y_max, z_min, z_max. raw_input is the raw bytes of the input file, with
+    lines of this format:
+    on x=-20..26,y=-36..17,z=-47..7
+    The parts only make Cuboids of the lines they use, rather than one per line here.
+    """
+    import numpy as np
+
+    raw = np.frombuffer(raw_input, dtype=np.uint8)
+    line_starts = np.concatenate([[0], np.flatnonzero(raw == ord('\n')) + 1])
+    line_starts = line_starts[line_starts < len(raw) - 1]
+    line_starts = line_starts[raw[line_starts] == ord('o')]
+    # 'on' and 'off' differ at their second letter
+    states = raw[line_starts + 1] == ord('n')
+    # Every line has exactly six numbers, so scan them all out in one go
+    bounds = aoc_utils.scan_ints(raw_input, 6)
+    return states, bounds
+
+
+def part_a(all_cuboids, just_50=True):
+    states, bounds = all_cuboids
+    # Throw out some of the cuboids if just_50. The question states that all of a cuboid will be within
+    # 50 of the origin or none of it will, so we can get away with testing just the min on each axis.
+    if just_50:
+        mins = bounds[:, [0, 2, 4]]
+        keep = ((mins >= -50) & (mins <= 50)).all(axis=1)
+        states, bounds = states[keep], bounds[keep]
+    cuboids = [Cuboid(state, *b) for state, b in zip(states.tolist(), bounds.tolist())]
     # Iterate through cuboids in order, comparing to each already processed cuboid. Any time
     # we find an intersection with a previous cuboid create a new cuboid that corrects for that
     # intersection.
@@ -99,11 +114,14 @@ def part_a(lines, just_50=True):
     return volume
 
 
-def part_b(lines):
-    return part_a(lines, just_50=False)
+def part_b(all_cuboids):
+    return part_a(all_cuboids, just_50=False)
     
 
 # test_and_execute is a utility function that runs the function with the correct input, checks that the 
 # output for the test data is the expected value, prints time it took to run, etc.
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, True)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent, parse_input=parse_input,
+                               input_mode=input_mode)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent, sep_part_b_input,
+                               parse_input=parse_input, input_mode=input_mode)
@@ -3,10 +3,10 @@
 # See day<number>-questions.txt for context to this solution
 
 import sys
-from rich import print
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 import aoc_utils
+from aoc_utils import print
 
 # import collections # https://docs.python.org/3/library/collections.html
 # import numpy # https://numpy.org/doc/stable/user/quickstart.html
@@ -27,6 +27,11 @@ day = '00'
 test_assertion_a = None
 test_assertion_b = None
 
+# Optionally parse the input once and share it between the parts. Pass parse_input=parse_input to
+# test_and_execute and part_a/part_b receive its result instead of lines. They must not modify it.
+# def parse_input(lines):
+#     return [int(l) for l in lines if l != '']
+
 def part_a(lines):
     # nums = [int(l) for l in lines if l != '']
     return
@@ -37,5 +42,6 @@ def part_b(lines):
 
 # test_and_execute is a utility function that runs the function with the correct input, checks that the 
 # output for the test data is the expected value, prints time it took to run, etc.
-aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
-aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)
+if __name__ == '__main__':
+    aoc_utils.test_and_execute(part_a, day, test_assertion_a, Path(__file__).parent)
+    aoc_utils.test_and_execute(part_b, day, test_assertion_b, Path(__file__).parent)